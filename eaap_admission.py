@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  admission queue
+Epoch-ordered holding area in front of the gate.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only.
+
+factor_F_freshness admits epochs in [logical_now - window, logical_now], so
+a candidate that arrives ahead of the logical clock is refused for being
+early. AdmissionQueue holds arrivals in a heap keyed by epoch (ties by
+arrival order) and, each time the clock advances, evicts everything that
+has gone stale in one batch (each still gets its REFUSE receipt) and drains
+everything now due, in epoch order, in another. Candidates with no epoch
+cannot be ordered and go through on the next advance unchanged.
+
+Use:  q = AdmissionQueue(gate); q.offer(c); ...; q.advance(logical_now)
+"""
+
+from __future__ import annotations
+import heapq
+import itertools
+
+
+class AdmissionQueue:
+    def __init__(self, gate, window=10):
+        self.gate = gate
+        self.window = window              # match factor_F_freshness's window
+        self.heap = []                    # (epoch, arrival, candidate)
+        self.unordered = []               # no epoch: next advance, as arrived
+        self._arrival = itertools.count()
+
+    def __len__(self):
+        return len(self.heap) + len(self.unordered)
+
+    def offer(self, candidate):
+        epoch = candidate.get("epoch")
+        if epoch is None:
+            self.unordered.append(candidate)
+        else:
+            heapq.heappush(self.heap, (epoch, next(self._arrival), candidate))
+
+    def advance(self, logical_now):
+        """Move the logical clock: stale candidates are refused in bulk, due
+        ones are submitted in epoch order; later epochs keep waiting.
+        Returns (refused receipts, admitted receipts)."""
+        stale = self._pop_while(lambda e: e < logical_now - self.window)
+        due = self._pop_while(lambda e: e <= logical_now) + self.unordered
+        self.unordered = []
+        refused = self.gate.submit_many(stale, logical_now) if stale else []
+        admitted = self.gate.submit_many(due, logical_now) if due else []
+        return refused, admitted
+
+    def _pop_while(self, test):
+        out = []
+        while self.heap and test(self.heap[0][0]):
+            out.append(heapq.heappop(self.heap)[2])
+        return out
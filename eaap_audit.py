@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  chain audit
+Verification tools for long receipt chains.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only.
+
+Checkpoints (Gate(checkpoint_every=N)) cut the chain into segments whose
+start and end heads are already known, so each segment can be re-hashed
+independently. verify_chain() hands in-memory segments to a process pool
+and reports the first receipt that does not hold. verify_log() does the same
+for a durable receipt log: the parent only reads the checkpoint file and the
+segment headers, and each worker reads its own byte range from its segment
+file, so nothing but offsets and one result per range crosses processes.
+"""
+
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from eaap_log import _SUFFIX, _records, read_checkpoints, read_header
+from eaap_proof import receipt_id
+
+
+def verify_segment(receipts, start_head, end_head=None):
+    """Walk one segment: every receipt id must be the digest of its content
+    and every prev_receipt_id must name the receipt before it, starting at
+    start_head. The segment tail must equal end_head when one is given.
+    Returns the offset of the first failing receipt, or None."""
+    prev = start_head
+    for i, r in enumerate(receipts):
+        content = r["content"]
+        if content["prev_receipt_id"] != prev or receipt_id(content) != r["receipt_id"]:
+            return i
+        prev = r["receipt_id"]
+    if end_head is not None and prev != end_head:
+        return max(len(receipts) - 1, 0)
+    return None
+
+
+def _verify_job(job):
+    return verify_segment(*job)
+
+
+def segments(receipts, checkpoints):
+    """(first index, receipts, start head, end head) per checkpoint segment.
+    receipts[0] is the receipt at checkpoints[0]["index"]; a tail past the
+    last checkpoint is its own segment with no recorded end head."""
+    base = checkpoints[0]["index"]
+    out = []
+    for cp, nxt in zip(checkpoints, checkpoints[1:] + [None]):
+        lo = cp["index"] - base
+        hi = len(receipts) if nxt is None else nxt["index"] - base
+        if lo < hi or nxt is not None:
+            out.append((cp["index"], receipts[lo:hi], cp["head"],
+                        None if nxt is None else nxt["head"]))
+    return out
+
+
+def verify_chain(receipts, checkpoints, workers=None):
+    """Verify a chain segment-wise across a process pool (workers=1 stays
+    in-process). Returns the chain index of the first receipt that fails,
+    or None when the whole chain and every checkpoint head holds."""
+    parts = segments(receipts, checkpoints)
+    jobs = [p[1:] for p in parts]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        results = map(_verify_job, jobs)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_verify_job, jobs,
+                                    chunksize=max(1, len(jobs) // (4 * workers))))
+    for (first, *_), bad in zip(parts, results):
+        if bad is not None:
+            return first + bad
+    return None
+
+
+def _verify_range(job):
+    """verify_segment() over the receipts stored in bytes [start, end) of
+    one segment file (end None: to the end of the file)."""
+    path, start, end, first, start_head, end_head = job
+    with open(path, "rb") as fh:
+        fh.seek(start)
+        data = fh.read(-1 if end is None else end - start)
+    records = _records(data)
+    if start == 0:
+        next(records, None)               # the segment header
+    bad = verify_segment([r["receipt"] for _, _, r in records],
+                         start_head, end_head)
+    return None if bad is None else first + bad
+
+
+def log_ranges(directory):
+    """(path, start, end, first index, start head, end head) per range of a
+    receipt log, cut at every segment start and every recorded checkpoint.
+    The last range of a segment ends at the next segment's header head."""
+    segs = sorted(n for n in os.listdir(directory) if n.endswith(_SUFFIX))
+    headers = [read_header(os.path.join(directory, n)) for n in segs]
+    by_segment = {}
+    for cp in read_checkpoints(directory):
+        by_segment.setdefault(cp["segment"], []).append(cp)
+    jobs = []
+    for i, (name, header) in enumerate(zip(segs, headers)):
+        if header is None:                # torn before the header landed
+            break
+        points = sorted({(0, header["count"], header["head"])} | {
+            (cp["offset"], cp["index"], cp["head"])
+            for cp in by_segment.get(header["segment"], ())})
+        nxt = headers[i + 1] if i + 1 < len(headers) else None
+        tail = None if nxt is None else nxt["head"]
+        path = os.path.join(directory, name)
+        for (start, first, head), after in zip(points, points[1:] + [None]):
+            end, end_head = (None, tail) if after is None else (after[0], after[2])
+            jobs.append((path, start, end, first, head, end_head))
+    return jobs
+
+
+def verify_log(directory, workers=None):
+    """verify_chain() for a receipt log on disk: every range is verified by
+    a worker reading its own segment file. Returns the chain index of the
+    first receipt that fails, or None."""
+    jobs = log_ranges(directory)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) < 2:
+        results = map(_verify_range, jobs)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_verify_range, jobs,
+                                    chunksize=max(1, len(jobs) // (4 * workers))))
+    for bad in results:
+        if bad is not None:
+            return bad
+    return None
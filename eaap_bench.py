@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  benchmark
+Throughput and footprint of the proof surface on synthetic load.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only.
+
+synth_candidates() is a seeded generator: the BIND/REFUSE/VEILED mix, the
+provenance-chain length and the evidence payload size are parameters, and
+the same seed always yields the same candidates (so the same chain head).
+run() measures receipts per second, p50/p99 submit latency, bytes per
+retained receipt and replay-verification throughput, and returns a JSON-able
+dict; main() writes it to a file so runs can be compared across versions.
+
+Run:  python3 eaap_bench.py -n 20000 --mix 0.6,0.3,0.1 --out bench.json
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import platform
+import random
+import time
+import tracemalloc
+
+from eaap_audit import verify_chain
+from eaap_proof import PROTOCOL_ID, VERSION, Gate, sign, verify_from
+
+_REFUSALS = ("resonance", "forged", "stale")
+
+
+def synth_candidates(n, seed=0, mix=(0.6, 0.3, 0.1), chain_len=2,
+                     payload_bytes=0, logical_now=100, actors=64):
+    """n candidates whose decisions follow mix = (BIND, REFUSE, VEILED)."""
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        actor = f"agent.bench.{rng.randrange(actors)}"
+        nonce = f"n{seed}.{i}"
+        c = {"id": f"b{i}", "actor": actor, "nonce": nonce,
+             "attestor_sig": sign(actor, nonce),
+             "resonance": round(rng.uniform(0.70, 1.0), 4),
+             "provenance_chain": ["root"] + [f"p{rng.randrange(1 << 16)}"
+                                             for _ in range(chain_len - 1)],
+             "epoch": logical_now - rng.randrange(10)}
+        if payload_bytes:
+            c["evidence"] = rng.randbytes(payload_bytes // 2 + 1).hex()[:payload_bytes]
+        kind = rng.choices(("BIND", "REFUSE", "VEILED"), weights=mix)[0]
+        if kind == "REFUSE":
+            how = rng.choice(_REFUSALS)
+            if how == "resonance":
+                c["resonance"] = round(rng.uniform(0.0, 0.69), 4)
+            elif how == "forged":
+                c["attestor_sig"] = "deadbeef"
+            else:
+                c["epoch"] = logical_now - 11 - rng.randrange(100)
+        elif kind == "VEILED":
+            del c["resonance"]
+        out.append(c)
+    return out
+
+
+def _percentile(sorted_values, q):
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def _retained_bytes(candidates, logical_now, **gate_opts):
+    tracemalloc.start()
+    g = Gate(**gate_opts)
+    base = tracemalloc.get_traced_memory()[0]
+    g.submit_many(candidates, logical_now)
+    used = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+    return round(used / max(1, len(candidates)), 1)
+
+
+def run(n=20000, seed=0, mix=(0.6, 0.3, 0.1), chain_len=2, payload_bytes=0,
+        logical_now=100, checkpoint_every=1000):
+    candidates = synth_candidates(n, seed, mix, chain_len, payload_bytes,
+                                  logical_now)
+
+    g = Gate(checkpoint_every=checkpoint_every)
+    lat = []
+    clock = time.perf_counter
+    t0 = clock()
+    for c in candidates:
+        t = clock()
+        g.submit(c, logical_now)
+        lat.append(clock() - t)
+    submit_s = clock() - t0
+    lat.sort()
+
+    gb = Gate()
+    t0 = clock()
+    gb.submit_many(candidates, logical_now)
+    batch_s = clock() - t0
+
+    t0 = clock()
+    replay_ok = all(verify_from(cp, candidates[cp["index"]:], nxt, logical_now)
+                    for cp, nxt in zip(g.checkpoints, g.checkpoints[1:]))
+    replay_s = clock() - t0
+
+    t0 = clock()
+    chain_ok = verify_chain(g.receipts, g.checkpoints, workers=1) is None
+    verify_s = clock() - t0
+
+    decisions = {}
+    for r in g.receipts:
+        d = r["content"]["decision"]
+        decisions[d] = decisions.get(d, 0) + 1
+
+    return {
+        "protocol": PROTOCOL_ID,
+        "version": VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "params": {"n": n, "seed": seed, "mix": list(mix),
+                   "chain_len": chain_len, "payload_bytes": payload_bytes,
+                   "logical_now": logical_now,
+                   "checkpoint_every": checkpoint_every},
+        "decisions": decisions,
+        "head": g.head,
+        "submit": {"receipts_per_s": round(n / submit_s, 1),
+                   "p50_us": round(_percentile(lat, 0.50) * 1e6, 2),
+                   "p99_us": round(_percentile(lat, 0.99) * 1e6, 2)},
+        "submit_many": {"receipts_per_s": round(n / batch_s, 1),
+                        "head_matches": gb.head == g.head},
+        "bytes_per_receipt": {
+            "dict": _retained_bytes(candidates, logical_now),
+            "compact": _retained_bytes(candidates, logical_now, compact=True),
+        },
+        "replay": {"receipts_per_s": round(n / replay_s, 1), "ok": replay_ok},
+        "verify_chain": {"receipts_per_s": round(n / verify_s, 1),
+                         "ok": chain_ok},
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description="EAAP proof-surface benchmark")
+    ap.add_argument("-n", type=int, default=20000)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--mix", default="0.6,0.3,0.1",
+                    help="BIND,REFUSE,VEILED weights")
+    ap.add_argument("--chain-len", type=int, default=2)
+    ap.add_argument("--payload-bytes", type=int, default=0)
+    ap.add_argument("--checkpoint-every", type=int, default=1000)
+    ap.add_argument("--out", help="write the JSON result here")
+    args = ap.parse_args()
+
+    result = run(args.n, args.seed, tuple(float(x) for x in args.mix.split(",")),
+                 args.chain_len, args.payload_bytes,
+                 checkpoint_every=args.checkpoint_every)
+    text = json.dumps(result, indent=2, sort_keys=True)
+    if args.out:
+        with open(args.out, "w") as fh:
+            fh.write(text + "\n")
+    print(text)
+    return 0 if result["replay"]["ok"] and result["verify_chain"]["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
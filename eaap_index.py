@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  receipt query index
+Secondary audit index over receipts in SQLite.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only (sqlite3).
+
+One row per receipt: chain index, receipt id, decision, actor, epoch, input
+digest and merit delta (an epoch that is not a 64-bit integer is stored as
+NULL), with B-tree indexes for the audit questions ("all REFUSE receipts
+for actor X", "all VEILED receipts in epochs a..b"). The
+database runs in WAL mode; rows are buffered and written in one transaction
+per submit batch (or every batch_rows rows for single submits), and every
+query flushes first. The index is derived data: the chain and the receipt
+log stay the record.
+
+Use:  Gate(index=ReceiptIndex("receipts.db"))
+"""
+
+from __future__ import annotations
+import sqlite3
+
+_COLUMNS = ("idx", "receipt_id", "decision", "actor", "epoch",
+            "input_digest", "merit_delta")
+_INT64 = (-(1 << 63), (1 << 63) - 1)
+
+
+def _epoch(value):
+    """The candidate's epoch if SQLite can hold it as INTEGER, else NULL."""
+    if type(value) is int and _INT64[0] <= value <= _INT64[1]:
+        return value
+    return None
+
+
+class ReceiptIndex:
+    def __init__(self, path, batch_rows=1024):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS receipts (
+                idx INTEGER PRIMARY KEY,
+                receipt_id TEXT NOT NULL,
+                decision TEXT NOT NULL,
+                actor TEXT,
+                epoch INTEGER,
+                input_digest TEXT NOT NULL,
+                merit_delta REAL NOT NULL);
+            CREATE INDEX IF NOT EXISTS receipts_rid ON receipts (receipt_id);
+            CREATE INDEX IF NOT EXISTS receipts_actor
+                ON receipts (actor, decision, idx);
+            CREATE INDEX IF NOT EXISTS receipts_decision_epoch
+                ON receipts (decision, epoch, idx);
+            CREATE INDEX IF NOT EXISTS receipts_digest ON receipts (input_digest);
+        """)
+        self.batch_rows = batch_rows
+        self._rows = []
+
+    def add(self, index, receipt, candidate):
+        content = receipt["content"]
+        actor = candidate.get("actor")
+        self._rows.append((index, receipt["receipt_id"], content["decision"],
+                           None if actor is None else str(actor),
+                           _epoch(candidate.get("epoch")), content["input_digest"],
+                           content["merit_delta"]))
+        if len(self._rows) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows in one transaction. The buffer is emptied
+        even when the write fails, so one bad batch cannot block the rest."""
+        if self._rows:
+            rows, self._rows = self._rows, []
+            with self.db:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO receipts VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows)
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    # --- audit queries -------------------------------------------------------
+    def _select(self, where, args, limit):
+        self.flush()
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM receipts WHERE {where} ORDER BY idx"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return [dict(zip(_COLUMNS, row)) for row in self.db.execute(sql, args)]
+
+    def by_actor(self, actor, decision=None, limit=None):
+        if decision is None:
+            return self._select("actor = ?", (actor,), limit)
+        return self._select("actor = ? AND decision = ?", (actor, decision), limit)
+
+    def by_decision(self, decision, epoch_lo=None, epoch_hi=None, limit=None):
+        """Receipts with this decision, optionally for candidate epochs in
+        epoch_lo..epoch_hi inclusive."""
+        if epoch_lo is None and epoch_hi is None:
+            return self._select("decision = ?", (decision,), limit)
+        lo = -(1 << 63) if epoch_lo is None else epoch_lo
+        hi = (1 << 63) - 1 if epoch_hi is None else epoch_hi
+        return self._select("decision = ? AND epoch BETWEEN ? AND ?",
+                            (decision, lo, hi), limit)
+
+    def by_receipt_id(self, rid):
+        rows = self._select("receipt_id = ?", (rid,), 1)
+        return rows[0] if rows else None
+
+    def by_digest(self, digest):
+        return self._select("input_digest = ?", (digest,), None)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  three-valued logic kernel
+Strong-Kleene gate arithmetic over NumPy arrays.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Optional: needs numpy (the proof surface itself stays stdlib-only).
+
+TRUE/UNKNOWN/FALSE are encoded as int8 +1/0/-1. On that order strong-Kleene
+conjunction is the minimum (FALSE dominates UNKNOWN dominates TRUE), so a
+whole (N x factors) matrix reduces to verdicts with one min() along axis 1.
+Decision, PoR and merit_delta follow as vectorised lookups; every result
+matches the scalar path in eaap_proof exactly.
+
+The factors themselves are still evaluated per candidate in Python, so the
+saving is in the reduction: each row is packed into one base-3 code and its
+(decision, factors, por) is looked up among the 81 possible rows instead of
+being rebuilt. Gate(kernel=eaap_kernel) routes submit_many() through it.
+"""
+
+from __future__ import annotations
+
+from eaap_proof import (DECISION, FALSE, TRUE, UNKNOWN, _FACTOR_KEYS,
+                        factor_A_attestation, factor_F_freshness,
+                        factor_P_provenance, factor_R_resonance)
+
+try:
+    import numpy as np
+except ImportError:                       # optional dependency
+    np = None
+
+CODE = {TRUE: 1, UNKNOWN: 0, FALSE: -1}
+_VALUES = (FALSE, UNKNOWN, TRUE)           # index = code + 1
+_DECISIONS = tuple(DECISION[v] for v in _VALUES)
+# row code = sum((value + 1) * 3**(3 - j)) -> (decision, factors, por)
+_ROWS = []
+for _code in range(3 ** len(_FACTOR_KEYS)):
+    _row = [(_code // 3 ** (3 - j)) % 3 - 1 for j in range(len(_FACTOR_KEYS))]
+    _ROWS.append((_DECISIONS[min(_row) + 1],
+                  {k: _VALUES[v + 1] for k, v in zip(_FACTOR_KEYS, _row)},
+                  1.0 if min(_row) == 1 else 0.0))
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("eaap_kernel needs numpy: pip install numpy")
+
+
+def encode(values):
+    """TRUE/FALSE/UNKNOWN strings (any shape of nested lists) -> int8 array."""
+    _require_numpy()
+    lookup = np.vectorize(CODE.__getitem__, otypes=[np.int8])
+    return lookup(np.asarray(values, dtype=object))
+
+
+def factor_matrix(candidates, logical_now, provenance=None):
+    """(N x 4) int8 matrix of A, R, P, F, evaluated column by column."""
+    _require_numpy()
+    code = CODE.__getitem__
+    cols = (
+        [code(factor_A_attestation(c)) for c in candidates],
+        [code(factor_R_resonance(c)) for c in candidates],
+        [code(factor_P_provenance(c, provenance)) for c in candidates],
+        [code(factor_F_freshness(c, logical_now)) for c in candidates],
+    )
+    return np.array(cols, dtype=np.int8).T
+
+
+def kleene_and(matrix):
+    """Row-wise strong-Kleene conjunction: the minimum code per row."""
+    _require_numpy()
+    return np.asarray(matrix, dtype=np.int8).min(axis=1)
+
+
+def decide(matrix, refusal_credit=0.5):
+    """(verdicts, decision codes, por, merit_delta) for every row.
+    Decision codes index ("REFUSE", "VEILED", "BIND") at verdict + 1."""
+    verdicts = kleene_and(matrix)
+    por = (verdicts == 1).astype(np.float64)      # product of TRUE=1 else 0
+    merit = np.where(verdicts == 1, por,
+                     np.where(verdicts == -1, refusal_credit, 0.0))
+    return verdicts, verdicts + 1, por, merit
+
+
+def evaluate_many(candidates, logical_now, provenance=None):
+    """Drop-in for eaap_proof.evaluate_many: same (decision, factors, por)
+    tuples, computed through the kernel. Every row gets its own factors
+    dict."""
+    candidates = list(candidates)
+    matrix = factor_matrix(candidates, logical_now, provenance)
+    codes = (matrix.astype(np.int16) + 1) @ np.array([27, 9, 3, 1], np.int16)
+    rows = _ROWS
+    out = []
+    for code in codes.tolist():
+        decision, factors, por = rows[code]
+        out.append((decision, factors.copy(), por))
+    return out
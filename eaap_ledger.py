@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  merit ledger
+Per-actor merit, indexed by logical epoch.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only.
+
+Gate.merit is one running total. MeritLedger keeps a Fenwick (binary
+indexed) tree per actor over the epochs it has accrued in, so "merit for
+actor X over epochs 100-200" is two O(log n) prefix sums instead of a scan
+of every receipt. Actors are keyed by str(actor), as the receipt index
+does, so any actor value the gate accepts can be attributed. Actor totals
+sit in a max-heap with lazy deletion for top-k: an update pushes one entry
+and stale entries are dropped as top() meets them, O(log n) amortised.
+
+Use:  Gate(ledger=MeritLedger())
+"""
+
+from __future__ import annotations
+import bisect
+import heapq
+
+
+class _Fenwick:
+    """Prefix sums over positions 0..n-1; positions can be appended."""
+
+    def __init__(self, points=()):
+        self.tree = [0.0]
+        for v in points:
+            self.append(v)
+
+    def __len__(self):
+        return len(self.tree) - 1
+
+    def append(self, value):
+        i = len(self.tree)                # node i covers [i - (i & -i), i)
+        self.tree.append(value + self.prefix(i - 1) - self.prefix(i - (i & -i)))
+
+    def add(self, i, delta):
+        i += 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        """Sum of positions [0, i)."""
+        i = min(i, len(self))
+        total = 0.0
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def points(self):
+        return [self.prefix(i + 1) - self.prefix(i) for i in range(len(self))]
+
+
+class _ActorSeries:
+    """One actor's merit by epoch: the sorted epochs it has accrued in and a
+    Fenwick tree over their ranks, so size follows the number of epochs with
+    merit, not their span. A new latest epoch is appended in O(log n); an
+    epoch earlier than the latest rebuilds the tree."""
+
+    def __init__(self, epoch):
+        self.epochs = [epoch]
+        self.fenwick = _Fenwick([0.0])
+
+    def add(self, epoch, delta):
+        i = bisect.bisect_left(self.epochs, epoch)
+        if i < len(self.epochs) and self.epochs[i] == epoch:
+            self.fenwick.add(i, delta)
+        elif i == len(self.epochs):
+            self.epochs.append(epoch)
+            self.fenwick.append(delta)
+        else:
+            points = self.fenwick.points()
+            points.insert(i, delta)
+            self.epochs.insert(i, epoch)
+            self.fenwick = _Fenwick(points)
+
+    def range(self, lo, hi):
+        """Merit over epochs lo..hi inclusive."""
+        lo = bisect.bisect_left(self.epochs, lo)
+        hi = bisect.bisect_right(self.epochs, hi)
+        if hi <= lo:
+            return 0.0
+        return self.fenwick.prefix(hi) - self.fenwick.prefix(lo)
+
+
+class MeritLedger:
+    """merit_delta by (actor, epoch): windowed range sums and top-k."""
+
+    def __init__(self):
+        self.series = {}                  # actor -> _ActorSeries
+        self.totals = {}                  # actor -> total merit
+        self._heap = []                   # (-total, actor); stale if total moved
+
+    def add(self, actor, epoch, delta):
+        if not delta or actor is None:    # nothing to attribute
+            return
+        actor = str(actor)
+        series = self.series.get(actor)
+        if series is None:
+            series = self.series[actor] = _ActorSeries(epoch)
+        series.add(epoch, delta)
+        self.totals[actor] = new = self.totals.get(actor, 0.0) + delta
+        heapq.heappush(self._heap, (-new, actor))
+        if len(self._heap) > 2 * len(self.totals) + 64:   # shed stale entries
+            self._heap = [(-t, a) for a, t in self.totals.items()]
+            heapq.heapify(self._heap)
+
+    def range(self, actor, lo, hi):
+        """Merit accrued by actor over epochs lo..hi inclusive."""
+        series = self.series.get(str(actor))
+        return 0.0 if series is None else series.range(lo, hi)
+
+    def total(self, actor):
+        return self.totals.get(str(actor), 0.0)
+
+    def top(self, k):
+        """The k actors with the most merit, highest first (ties by actor)."""
+        out, seen = [], set()
+        while self._heap and len(out) < k:
+            neg, actor = heapq.heappop(self._heap)
+            if actor not in seen and self.totals[actor] == -neg:
+                seen.add(actor)
+                out.append((actor, -neg))
+        for actor, total in out:          # live entries go back
+            heapq.heappush(self._heap, (-total, actor))
+        return out
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  receipt log
+Durable, segmented, append-only storage for Gate receipts.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only.
+
+Layout: a directory of segment files 00000000.seg, 00000001.seg, ...
+Every record is a 4-byte big-endian length followed by canonical JSON.
+The first record of each segment is a header carrying the gate state at the
+moment the segment was opened (head, merit, effects, receipt count, MMR level
+sizes and peaks), so a restart recovers by scanning the tail segment only.
+Sealed segments are never written again and may be memory-mapped for lookup
+by offset. Every MMR node over the receipt ids is appended to mmr.nodes
+(32 bytes each, in creation order), so ReceiptLog.inclusion_proof() serves
+a proof for any receipt while the gate itself keeps peaks only. Gate
+checkpoints (Gate(checkpoint_every=N)) are appended to checkpoints.jsonl
+with the (segment, offset) where the next receipt lands, so an auditor can
+cut the log into ranges and verify them in parallel straight from the
+segment files (eaap_audit.verify_log).
+
+Use:  Gate(log=ReceiptLog("receipts/"))
+"""
+
+from __future__ import annotations
+import json
+import mmap
+import os
+import struct
+
+from eaap_proof import Gate, MerkleMountainRange, canon
+
+_LEN = struct.Struct(">I")
+_SUFFIX = ".seg"
+CHECKPOINTS = "checkpoints.jsonl"
+MMR_NODES = "mmr.nodes"
+_NODE = 32
+
+
+def _bits(n):
+    return bin(n).count("1")
+
+
+def _nodes_before(leaves):
+    """MMR nodes created by the first `leaves` appends."""
+    return 2 * leaves - _bits(leaves)
+
+
+def _node_pos(h, j):
+    """Creation-order position of node j at height h: created right after
+    the leaf that completes its subtree, h nodes above it."""
+    leaf = ((j + 1) << h) - 1
+    return _nodes_before(leaf) + h
+
+
+class ReceiptLog:
+    """Append-only receipt log. The gate calls recover() once at start-up and
+    append() once per receipt; everything else is for auditors.
+
+    append() writes through a buffered file and fsyncs every `fsync_every`
+    appends, so a crash can lose up to fsync_every - 1 receipts that the gate
+    has already returned (recovery then resumes at the last durable one).
+    fsync_every=1 makes every receipt durable before submit() returns."""
+
+    def __init__(self, directory, segment_bytes=64 << 20, fsync_every=64):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync_every = fsync_every
+        os.makedirs(directory, exist_ok=True)
+        self.segments = sorted(int(n[:-len(_SUFFIX)])
+                               for n in os.listdir(directory)
+                               if n.endswith(_SUFFIX))
+        self._maps = {}                    # sealed segment -> mmap
+        self._pending = 0                  # appends since the last fsync
+        self.head, self.merit, self.effects, self.count = (
+            Gate.GENESIS, 0.0, [], 0)
+        self.mmr = MerkleMountainRange(prune=True)   # peaks over receipt ids
+        nodes = os.path.join(directory, MMR_NODES)
+        self._nodes_fh = open(nodes, "r+b" if os.path.exists(nodes) else "w+b")
+        self._nodes_len = os.path.getsize(nodes) // _NODE
+        if self.segments:
+            self._scan_tail()
+        if self.segments:
+            self._fh = open(self._path(self.segments[-1]), "ab")
+        else:
+            self._open_segment(0)
+        self._recover_nodes()
+        self._cpfh = self._recover_checkpoints()
+
+    # --- recovery ------------------------------------------------------------
+    def recover(self):
+        """(head, merit, effects, count) as of the last durable record."""
+        return self.head, self.merit, list(self.effects), self.count
+
+    def _scan_tail(self):
+        path = self._path(self.segments[-1])
+        with open(path, "rb") as fh:
+            data = fh.read()
+        records = _records(data)
+        first = next(records, None)
+        if first is None:                  # torn before the header landed
+            os.remove(path)
+            self.segments.pop()
+            if self.segments:
+                self._scan_tail()
+            return
+        end, header = first[1:]
+        self.head, self.merit = header["head"], header["merit"]
+        self.effects, self.count = header["effects"], header["count"]
+        self.mmr = MerkleMountainRange.from_peaks(
+            header["mmr_sizes"], [bytes.fromhex(p) for p in header["mmr_peaks"]])
+        for _, end, record in records:
+            self._apply(record)
+        if end < len(data):                # drop a torn trailing record
+            with open(path, "r+b") as fh:
+                fh.truncate(end)
+
+    def _recover_nodes(self):
+        """Trim mmr.nodes to the recovered receipt count; a file missing
+        nodes from before the tail segment (or none at all) is rebuilt
+        from every segment once."""
+        want = _nodes_before(self.count)
+        if self._nodes_len < want:
+            mmr, self._nodes_len = MerkleMountainRange(prune=True), 0
+            self._nodes_fh.seek(0)
+            for r in self:
+                self._nodes_len += self._nodes_fh.write(
+                    b"".join(mmr.append(r["receipt_id"]))) // _NODE
+        self._nodes_fh.truncate(want * _NODE)
+        self._nodes_len = want
+
+    def _recover_checkpoints(self):
+        """Drop checkpoints past the last durable receipt (a crash can leave
+        them behind the segment data) and reopen the file for appending."""
+        path = os.path.join(self.directory, CHECKPOINTS)
+        kept = [cp for cp in read_checkpoints(self.directory)
+                if cp["index"] <= self.count]
+        with open(path, "w") as fh:
+            fh.writelines(canon(cp) + "\n" for cp in kept)
+        return open(path, "a")
+
+    def _apply(self, record):
+        content = record["receipt"]["content"]
+        if content["decision"] == "BIND":
+            self.effects.append(record["effect"])
+        self.merit += content["merit_delta"]
+        self.head = record["receipt"]["receipt_id"]
+        created = self.mmr.append(self.head)
+        pos = _nodes_before(self.count)
+        # recovery replays receipts whose nodes may already be on disk; a
+        # gap (nodes lost before the tail) is left to _recover_nodes()
+        if pos <= self._nodes_len < pos + len(created):
+            self._nodes_fh.seek(pos * _NODE)
+            self._nodes_fh.write(b"".join(created))
+            self._nodes_len = pos + len(created)
+        self.count += 1
+
+    # --- append --------------------------------------------------------------
+    def append(self, receipt, effect=None):
+        """Write one receipt; returns its (segment, offset) address."""
+        if self._fh.tell() >= self.segment_bytes:
+            self._seal()
+            self._open_segment(self.segments[-1] + 1)
+        record = {"effect": effect, "receipt": receipt}
+        offset = self._write(record)
+        self._apply(record)
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            self.sync()
+        return self.segments[-1], offset
+
+    def checkpoint(self, cp):
+        """Record a gate checkpoint at the current end of the log."""
+        segment, offset = self.position()
+        self._cpfh.write(canon({**cp, "offset": offset, "segment": segment})
+                         + "\n")
+        self._cpfh.flush()
+
+    def position(self):
+        """(tail segment, end offset): where the next record will land."""
+        self._fh.flush()
+        return self.segments[-1], self._fh.tell()
+
+    def sync(self):
+        # nodes first: after a crash they may run ahead of the receipts
+        # (trimmed on recovery) but never fall behind the sealed segments
+        self._nodes_fh.flush()
+        os.fsync(self._nodes_fh.fileno())
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._pending = 0
+
+    def close(self):
+        self.sync()
+        self._fh.close()
+        self._cpfh.close()
+        self._nodes_fh.close()
+        for m in self._maps.values():
+            m.close()
+        self._maps.clear()
+
+    def _open_segment(self, n):
+        self.segments.append(n)
+        self._fh = open(self._path(n), "ab")
+        self._write({"count": self.count, "effects": self.effects,
+                     "head": self.head, "merit": self.merit,
+                     "mmr_peaks": [p.hex() for p in self.mmr.peaks()],
+                     "mmr_sizes": self.mmr.sizes, "segment": n})
+        self.sync()
+
+    def _seal(self):
+        self.sync()
+        self._fh.close()
+
+    def _write(self, record):
+        payload = canon(record).encode()
+        offset = self._fh.tell()
+        self._fh.write(_LEN.pack(len(payload)) + payload)
+        return offset
+
+    # --- lookup --------------------------------------------------------------
+    def inclusion_proof(self, index):
+        """MerkleMountainRange.proof() for receipt `index`, read from the
+        persisted nodes; checks with eaap_proof.verify_inclusion."""
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        self._nodes_fh.flush()
+        fd = self._nodes_fh.fileno()
+
+        def node(h, j):
+            return os.pread(fd, _NODE, _node_pos(h, j) * _NODE)
+
+        path, h, j = [], 0, index
+        while ((j ^ 1) + 1) << h <= self.count:   # sibling subtree complete
+            path.append(["L" if j & 1 else "R", node(h, j ^ 1).hex()])
+            h, j = h + 1, j >> 1
+        peaks = self.mmr.peaks()
+        return {"index": index, "path": path, "peak": peaks.index(node(h, j)),
+                "peaks": [p.hex() for p in peaks]}
+
+    def read(self, segment, offset):
+        """The receipt stored at (segment, offset); sealed segments are read
+        through mmap."""
+        buf = self._map(segment)
+        (n,) = _LEN.unpack_from(buf, offset)
+        start = offset + _LEN.size
+        return json.loads(buf[start:start + n])["receipt"]
+
+    def __iter__(self):
+        """Every receipt in chain order, segment by segment."""
+        for n in self.segments:
+            records = _records(self._map(n))
+            next(records, None)            # skip the segment header
+            for _, _, record in records:
+                yield record["receipt"]
+
+    def _map(self, segment):
+        if segment == self.segments[-1]:   # tail still grows: plain read
+            self._fh.flush()
+            with open(self._path(segment), "rb") as fh:
+                return fh.read()
+        if segment not in self._maps:
+            with open(self._path(segment), "rb") as fh:
+                self._maps[segment] = mmap.mmap(fh.fileno(), 0,
+                                                access=mmap.ACCESS_READ)
+        return self._maps[segment]
+
+    def _path(self, n):
+        return os.path.join(self.directory, f"{n:08d}{_SUFFIX}")
+
+
+def read_checkpoints(directory):
+    """Every checkpoint recorded in a log directory, oldest first; a torn
+    last line is ignored."""
+    try:
+        with open(os.path.join(directory, CHECKPOINTS)) as fh:
+            lines = fh.read().split("\n")
+    except FileNotFoundError:
+        return []
+    out = []
+    for line in lines:
+        try:
+            out.append(json.loads(line))
+        except ValueError:
+            break
+    return out
+
+
+def read_header(path):
+    """The header record of one segment file, or None if it is torn."""
+    with open(path, "rb") as fh:
+        prefix = fh.read(_LEN.size)
+        if len(prefix) < _LEN.size:
+            return None
+        (n,) = _LEN.unpack(prefix)
+        data = fh.read(n)
+    try:
+        return json.loads(data) if len(data) == n else None
+    except ValueError:
+        return None
+
+
+def _records(buf):
+    """Yield (offset, end, record) for every complete record in buf; stops at
+    the first torn or unparsable one."""
+    offset, size = 0, len(buf)
+    while offset + _LEN.size <= size:
+        (n,) = _LEN.unpack_from(buf, offset)
+        end = offset + _LEN.size + n
+        if end > size:
+            return
+        try:
+            record = json.loads(buf[offset + _LEN.size:end])
+        except ValueError:
+            return
+        yield offset, end, record
+        offset = end
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  instrumentation
+Where the gate spends its time, factor by factor.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only.
+
+eaap_proof carries a module-level METRICS slot that is None by default; every
+hook is a single `is not None` test, so a disabled gate pays nothing else.
+enable() installs a Metrics collector that keeps:
+  - timing histograms per stage (factor_A..factor_F, canon_input,
+    canon_receipt, submit, submit_many)
+  - TRUE/FALSE/UNKNOWN counters per factor
+  - decision counters
+  - canonical bytes hashed, for candidate inputs and receipt contents
+Read it as snapshot() (a plain dict) or prometheus() (text exposition).
+Wall-clock readings never enter a receipt.
+
+Use:  m = eaap_metrics.enable(); ...; print(m.prometheus())
+"""
+
+from __future__ import annotations
+import bisect
+import time
+
+import eaap_proof
+
+# seconds; one more implicit +Inf bucket
+BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+           1e-3, 2.5e-3, 1e-2)
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "n")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.n = 0
+
+    def observe(self, seconds, n=1):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += n
+        self.sum += seconds * n
+        self.n += n
+
+
+class Metrics:
+    clock = staticmethod(time.perf_counter)
+
+    def __init__(self):
+        self.stages = {}                  # stage -> _Histogram
+        self.factors = {}                 # (factor, value) -> count
+        self.decisions = {}               # decision -> count
+        self.hashed = {}                  # "input" / "receipt" -> bytes
+
+    def observe(self, stage, seconds, n=1):
+        """Record n observations of `seconds` each (columnar batches record
+        their per-candidate mean)."""
+        h = self.stages.get(stage)
+        if h is None:
+            h = self.stages[stage] = _Histogram()
+        h.observe(seconds, n)
+
+    def factor(self, key, value, seconds, n=1):
+        self.observe("factor_" + key, seconds, n)
+        self.factors[(key, value)] = self.factors.get((key, value), 0) + n
+
+    def decision(self, decision):
+        self.decisions[decision] = self.decisions.get(decision, 0) + 1
+
+    def canonical(self, kind, nbytes, seconds):
+        self.observe("canon_" + kind, seconds)
+        self.hashed[kind] = self.hashed.get(kind, 0) + nbytes
+
+    def snapshot(self):
+        return {
+            "stages": {s: {"count": h.n, "sum_s": h.sum,
+                           "buckets": dict(zip([*map(str, BUCKETS), "+Inf"],
+                                               h.counts))}
+                       for s, h in sorted(self.stages.items())},
+            "factors": {f"{k}.{v}": n for (k, v), n in sorted(self.factors.items())},
+            "decisions": dict(sorted(self.decisions.items())),
+            "canonical_bytes": dict(sorted(self.hashed.items())),
+        }
+
+    def prometheus(self):
+        lines = ["# HELP eaap_stage_seconds Time spent per gate stage.",
+                 "# TYPE eaap_stage_seconds histogram"]
+        for stage, h in sorted(self.stages.items()):
+            cum = 0
+            for le, n in zip([*map(repr, BUCKETS), "+Inf"], h.counts):
+                cum += n
+                lines.append(f'eaap_stage_seconds_bucket{{stage="{stage}",'
+                             f'le="{le}"}} {cum}')
+            lines.append(f'eaap_stage_seconds_sum{{stage="{stage}"}} {h.sum!r}')
+            lines.append(f'eaap_stage_seconds_count{{stage="{stage}"}} {h.n}')
+        lines += ["# HELP eaap_factor_total Factor results by value.",
+                  "# TYPE eaap_factor_total counter"]
+        lines += [f'eaap_factor_total{{factor="{k}",value="{v}"}} {n}'
+                  for (k, v), n in sorted(self.factors.items())]
+        lines += ["# HELP eaap_decision_total Gate decisions.",
+                  "# TYPE eaap_decision_total counter"]
+        lines += [f'eaap_decision_total{{decision="{d}"}} {n}'
+                  for d, n in sorted(self.decisions.items())]
+        lines += ["# HELP eaap_canonical_bytes_total Canonical JSON bytes hashed.",
+                  "# TYPE eaap_canonical_bytes_total counter"]
+        lines += [f'eaap_canonical_bytes_total{{kind="{k}"}} {n}'
+                  for k, n in sorted(self.hashed.items())]
+        return "\n".join(lines) + "\n"
+
+
+def enable():
+    """Install a fresh collector in eaap_proof and return it."""
+    eaap_proof.METRICS = Metrics()
+    return eaap_proof.METRICS
+
+
+def disable():
+    eaap_proof.METRICS = None
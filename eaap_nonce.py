@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  nonce replay index
+Remembers which attested (actor, nonce) pairs the gate has already seen.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only (sqlite3 for the spill store).
+
+factor_A_attestation proves a signature over actor|nonce, not that the pair
+is new. NonceIndex keeps one exact set per logical epoch and a single
+counting Bloom filter over every live epoch; a filter miss answers "new"
+with one hash of the key, a hit is confirmed exactly. When the resident
+sets grow past max_resident the oldest generation spills to an on-disk
+SQLite table. A generation expires once it falls out of the freshness
+window and its keys are counted back out of the filter: a nonce is assumed
+to be issued for one window only, so past it a replay is refused by
+factor_F_freshness instead.
+
+Use:  Gate(nonces=NonceIndex(window=10))
+"""
+
+from __future__ import annotations
+import hashlib
+import sqlite3
+
+
+class _CountingBloom:
+    """Bloom filter with a one-byte counter per slot, so keys can be removed
+    again. A counter that reaches 255 sticks there (never a false miss)."""
+
+    def __init__(self, slots, hashes):
+        self.slots = slots
+        self.hashes = hashes
+        self.counts = bytearray(slots)
+
+    def positions(self, key):
+        d = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        return [(h1 + i * h2) % self.slots for i in range(self.hashes)]
+
+    def add(self, positions):
+        counts = self.counts
+        for p in positions:
+            if counts[p] < 255:
+                counts[p] += 1
+
+    def remove(self, positions):
+        counts = self.counts
+        for p in positions:
+            if 0 < counts[p] < 255:
+                counts[p] -= 1
+
+    def has(self, positions):
+        counts = self.counts
+        for p in positions:
+            if not counts[p]:
+                return False
+        return True
+
+
+class NonceIndex:
+    """Bounded replay index: O(1) expected per check (expiry is amortised
+    over the keys it removes), memory capped by bloom_bits one-byte counters
+    plus max_resident exact keys."""
+
+    def __init__(self, window=10, bloom_bits=1 << 23, hashes=7,
+                 max_resident=1_000_000, spill_path=""):
+        self.window = window              # match factor_F_freshness's window
+        self.bloom_bits = bloom_bits
+        self.hashes = hashes
+        self.max_resident = max_resident
+        self.bloom = _CountingBloom(bloom_bits, hashes)   # every live epoch
+        self.gens = {}                    # epoch -> exact set | None (spilled)
+        self.resident = 0
+        # "" is SQLite's private temporary on-disk database
+        self.db = sqlite3.connect(spill_path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS nonces "
+                        "(epoch INTEGER, key BLOB, PRIMARY KEY (epoch, key))")
+        self.spilled = set()              # epochs whose keys live in the db
+
+    def seen(self, actor, nonce, logical_now):
+        """True if (actor, nonce) was recorded within the window; otherwise
+        records it under logical_now and returns False."""
+        self.expire(logical_now)
+        key = f"{actor}|{nonce}".encode()
+        positions = self.bloom.positions(key)
+        if self.bloom.has(positions):     # maybe seen: confirm exactly
+            for epoch, exact in self.gens.items():
+                if exact is not None:
+                    if key in exact:
+                        return True
+                elif self.db.execute("SELECT 1 FROM nonces WHERE epoch=? AND key=?",
+                                     (epoch, key)).fetchone():
+                    return True
+        self.bloom.add(positions)
+        self._add(key, logical_now)
+        return False
+
+    def _add(self, key, epoch):
+        if epoch not in self.gens:
+            self.gens[epoch] = set()
+        exact = self.gens[epoch]
+        if exact is None:                 # this epoch already spilled
+            self.db.execute("INSERT OR IGNORE INTO nonces VALUES (?, ?)",
+                            (epoch, key))
+            return
+        exact.add(key)
+        self.resident += 1
+        while self.resident > self.max_resident and self._spill_oldest():
+            pass
+
+    def _spill_oldest(self):
+        resident = [e for e, exact in self.gens.items() if exact]
+        if not resident:
+            return False
+        epoch = min(resident)
+        exact = self.gens[epoch]
+        with self.db:
+            self.db.executemany("INSERT OR IGNORE INTO nonces VALUES (?, ?)",
+                                ((epoch, k) for k in exact))
+        self.resident -= len(exact)
+        self.gens[epoch] = None
+        self.spilled.add(epoch)
+        return True
+
+    def expire(self, logical_now):
+        """Drop every generation older than the freshness window and count
+        its keys back out of the filter."""
+        cutoff = logical_now - self.window
+        for epoch in [e for e in self.gens if e < cutoff]:
+            exact = self.gens.pop(epoch)
+            if exact is not None:
+                self.resident -= len(exact)
+            else:
+                exact = [k for (k,) in self.db.execute(
+                    "SELECT key FROM nonces WHERE epoch=?", (epoch,))]
+            for key in exact:
+                self.bloom.remove(self.bloom.positions(key))
+        stale = [e for e in self.spilled if e < cutoff]
+        if stale:
+            with self.db:
+                self.db.execute("DELETE FROM nonces WHERE epoch < ?", (cutoff,))
+            self.spilled.difference_update(stale)
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  parallel evaluation pipeline
+Factors in parallel, chain order in one place.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only.
+
+Nothing in evaluate() or input_digest() depends on chain position; only the
+prev_receipt_id fold does. Pipeline sends chunks of candidates to a process
+pool that evaluates the four factors and computes input_digest, and a single
+sequencer in the calling process takes the results back in submission order
+and folds them into the gate (replay check, dedupe, receipt, chain). Each
+chunk carries the provenance nodes its `provenance` ids reach in the gate's
+store at submit time, so workers never read a store of their own. Every
+receipt is byte-identical to serial Gate.submit().
+
+Use:  with Pipeline(gate) as p:
+          receipts = p.submit_many(candidates, logical_now)
+"""
+
+from __future__ import annotations
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from eaap_proof import (FactorPlanner, ProvenanceStore, evaluate_many,
+                        evaluate_many_lazy, input_digest)
+
+
+def _evaluate_chunk(job):
+    candidates, logical_now, order, nodes = job
+    store = None if nodes is None else ProvenanceStore(nodes)
+    if order is None:
+        evaluated = evaluate_many(candidates, logical_now, store)
+    else:                                 # the gate's lazy order, fixed here
+        evaluated = evaluate_many_lazy(candidates, logical_now,
+                                       FactorPlanner(order), store)
+    return [(decision, factors, por, input_digest(c))
+            for c, (decision, factors, por) in zip(candidates, evaluated)]
+
+
+class Pipeline:
+    """Process-pool evaluation in front of one gate's sequencer. Metrics
+    (eaap_metrics) and a lazy gate's planner statistics only see the
+    sequencer side."""
+
+    def __init__(self, gate, workers=None, chunk=512):
+        self.gate = gate
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk = chunk
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.pool.shutdown()
+
+    def submit_many(self, candidates, logical_now):
+        candidates = list(candidates)
+        chunks = [candidates[i:i + self.chunk]
+                  for i in range(0, len(candidates), self.chunk)]
+        g = self.gate
+        order = None if g.lazy is None else g.lazy.order
+        out = []
+        # map() yields in submission order, so the fold can start as soon as
+        # the first chunk is back while later chunks are still evaluating
+        evaluated = self.pool.map(_evaluate_chunk,
+                                  [(chunk, logical_now, order,
+                                    self._nodes(chunk)) for chunk in chunks])
+        for chunk, results in zip(chunks, evaluated):
+            for c, (decision, factors, por, digest) in zip(chunk, results):
+                if g.dedupe and digest in g._recent:
+                    out.append(g._recent[digest])
+                    continue
+                out.append(g._admit(c, decision, factors, por, logical_now,
+                                    digest))
+        if g.index is not None:
+            g.index.flush()
+        return out
+
+    def _nodes(self, chunk):
+        """The gate's provenance nodes the chunk's `provenance` ids reach."""
+        store = self.gate.provenance
+        if store is None:
+            return None
+        return store.ancestry(c.get("provenance") for c in chunk)
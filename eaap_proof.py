@@ -27,7 +27,12 @@ It answers six questions, by line:
 from __future__ import annotations
 import hashlib
 import hmac
+import itertools
 import json
+import os
+import struct
+import time
+from collections import OrderedDict, deque
 
 PROTOCOL_ID = "ERES-EAAP-PROOFSURFACE-2026-001"
 VERSION = "v1.0"
@@ -35,6 +40,9 @@ VERSION = "v1.0"
 # Demo attestation key. In deployment this is TPM/TEE-held and never in source.
 _ATTEST_KEY = b"ERES-DEMO-ATTEST-KEY"
 
+# Optional instrumentation (eaap_metrics.enable()); None costs one test per hook.
+METRICS = None
+
 # --- three-valued logic over {TRUE, FALSE, UNKNOWN} --------------------------
 TRUE, FALSE, UNKNOWN = "TRUE", "FALSE", "UNKNOWN"
 
@@ -49,15 +57,141 @@ def kleene_and(values):
     return TRUE
 
 
+# --- attestation MAC ---------------------------------------------------------
+class AttestationVerifier:
+    """HMAC-SHA256 over actor|nonce with the key schedule done once: the
+    pre-keyed state is copied per message instead of re-deriving the pads.
+    A bounded LRU of ("actor|nonce", sig) -> verdict lets bursts of identical
+    resubmissions skip the MAC; hits/misses count cache use. The key is the
+    MACed message itself, so it is hashable whatever actor and nonce are; a
+    non-string sig bypasses the cache."""
+
+    def __init__(self, key, cache_size=4096):
+        self._keyed = hmac.new(key, digestmod=hashlib.sha256)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def expected(self, actor, nonce):
+        return self._mac(f"{actor}|{nonce}")
+
+    def _mac(self, message):
+        mac = self._keyed.copy()
+        mac.update(message.encode())
+        return mac.hexdigest()
+
+    def verify(self, actor, nonce, sig):
+        message = f"{actor}|{nonce}"
+        if not isinstance(sig, str):
+            return hmac.compare_digest(sig, self._mac(message))
+        key = (message, sig)
+        verdict = self._cache.get(key)
+        if verdict is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return verdict
+        self.misses += 1
+        verdict = hmac.compare_digest(sig, self._mac(message))
+        self._cache[key] = verdict
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return verdict
+
+
+ATTESTER = AttestationVerifier(_ATTEST_KEY)
+
+
+# --- provenance DAG ------------------------------------------------------------
+class ProvenanceStore:
+    """Content-addressed provenance: a node is {"label", "parents"} and its
+    id is the SHA-256 of its canonical form, so shared ancestry is stored
+    once and a candidate carries one id instead of its whole chain. Nodes may
+    arrive before their parents; verify() walks only ancestry not already
+    proven and memoises every node it proves. A store is an explicit gate
+    dependency (Gate(provenance=...)), never ambient state, so whoever
+    replays a chain must hand it the same nodes."""
+
+    def __init__(self, nodes=None):
+        self.nodes = dict(nodes or {})    # id -> node
+        self._verified = set()            # ids whose full ancestry is present
+        self._ids = {}                    # (label, parents) -> id, for put()
+
+    def add(self, node):
+        nid = hashlib.sha256(canon(node).encode()).hexdigest()
+        self.nodes[nid] = node
+        return nid
+
+    def put(self, label, parents=()):
+        parents = sorted(parents)
+        key = (label, tuple(parents))
+        nid = self._ids.get(key)          # repeated chain prefixes hash once
+        if nid is None:
+            nid = self._ids[key] = self.add({"label": label, "parents": parents})
+        return nid
+
+    def put_chain(self, labels):
+        """Store an inline provenance_chain; returns the id of its last node."""
+        nid = None
+        for label in labels:
+            nid = self.put(label, [] if nid is None else [nid])
+        return nid
+
+    def verify(self, nid):
+        """TRUE when every ancestor of nid is present and well formed,
+        UNKNOWN when some ancestor has not arrived, FALSE when malformed or
+        stored under an id that is not the hash of its content."""
+        if not isinstance(nid, str):
+            return FALSE
+        stack, seen = [nid], set()
+        while stack:
+            cur = stack.pop()
+            if cur in self._verified or cur in seen:
+                continue
+            node = self.nodes.get(cur)
+            if node is None:
+                return UNKNOWN
+            parents = node.get("parents") if isinstance(node, dict) else None
+            if (not isinstance(parents, list)
+                    or not all(isinstance(p, str) for p in parents)
+                    or not isinstance(node.get("label"), str)):
+                return FALSE
+            try:
+                digest = hashlib.sha256(canon(node).encode()).hexdigest()
+            except (TypeError, ValueError):      # not canonical JSON
+                return FALSE
+            if digest != cur:
+                return FALSE
+            seen.add(cur)
+            stack.extend(parents)
+        self._verified |= seen
+        return TRUE
+
+    def ancestry(self, nids):
+        """The stored nodes reachable from nids: all verify() can read for
+        them, e.g. to ship to a worker process as ProvenanceStore(nodes)."""
+        out, stack = {}, [n for n in nids if isinstance(n, str)]
+        while stack:
+            cur = stack.pop()
+            if cur in out:
+                continue
+            node = self.nodes.get(cur)
+            if node is None:
+                continue
+            out[cur] = node
+            parents = node.get("parents") if isinstance(node, dict) else None
+            if isinstance(parents, list):
+                stack.extend(p for p in parents if isinstance(p, str))
+        return out
+
+
 # --- the four Proof-of-Resonance factors (each total; never raises) ----------
 def factor_A_attestation(c):
     """A - Attestation: is the actor cryptographically attested?"""
     sig, actor, nonce = c.get("attestor_sig"), c.get("actor"), c.get("nonce")
     if sig is None or actor is None or nonce is None:
         return UNKNOWN
-    expected = hmac.new(_ATTEST_KEY, f"{actor}|{nonce}".encode(),
-                        hashlib.sha256).hexdigest()
-    return TRUE if hmac.compare_digest(sig, expected) else FALSE
+    return TRUE if ATTESTER.verify(actor, nonce, sig) else FALSE
 
 
 def factor_R_resonance(c, threshold=0.70):
@@ -68,8 +202,13 @@ def factor_R_resonance(c, threshold=0.70):
     return TRUE if r >= threshold else FALSE
 
 
-def factor_P_provenance(c):
-    """P - Provenance: is there a non-empty, well-formed provenance chain?"""
+def factor_P_provenance(c, store=None):
+    """P - Provenance: is there a non-empty, well-formed provenance chain,
+    inline or as a `provenance` node id in `store`? A node id with no store
+    to resolve it against is UNKNOWN."""
+    ref = c.get("provenance")
+    if ref is not None:
+        return UNKNOWN if store is None else store.verify(ref)
     chain = c.get("provenance_chain")
     if chain is None:
         return UNKNOWN
@@ -88,13 +227,31 @@ def factor_F_freshness(c, logical_now, window=10):
 
 # --- the gate ----------------------------------------------------------------
 DECISION = {TRUE: "BIND", FALSE: "REFUSE", UNKNOWN: "VEILED"}
+_FACTOR_KEYS = ("A", "R", "P", "F")
+# candidate fields each factor reads; resolve() patches only these
+FACTOR_FIELDS = {"A": ("attestor_sig", "actor", "nonce"), "R": ("resonance",),
+                 "P": ("provenance", "provenance_chain"), "F": ("epoch",)}
+SKIPPED = "SKIPPED"                       # lazy mode: not needed once FALSE
+
+
+def evaluate_factor(key, candidate, logical_now, provenance=None):
+    """One factor by name ("A", "R", "P" or "F")."""
+    if key == "A":
+        return factor_A_attestation(candidate)
+    if key == "R":
+        return factor_R_resonance(candidate)
+    if key == "P":
+        return factor_P_provenance(candidate, provenance)
+    return factor_F_freshness(candidate, logical_now)
 
 
-def evaluate(candidate, logical_now):
+def evaluate(candidate, logical_now, provenance=None):
+    if METRICS is not None:
+        return _evaluate_timed(candidate, logical_now, METRICS, provenance)
     factors = {
         "A": factor_A_attestation(candidate),
         "R": factor_R_resonance(candidate),
-        "P": factor_P_provenance(candidate),
+        "P": factor_P_provenance(candidate, provenance),
         "F": factor_F_freshness(candidate, logical_now),
     }
     decision = DECISION[kleene_and(list(factors.values()))]
@@ -104,6 +261,134 @@ def evaluate(candidate, logical_now):
     return decision, factors, por
 
 
+def _evaluate_timed(candidate, logical_now, m, provenance=None):
+    factors = {}
+    for k in _FACTOR_KEYS:
+        t = m.clock()
+        factors[k] = v = evaluate_factor(k, candidate, logical_now, provenance)
+        m.factor(k, v, m.clock() - t)
+    verdict = kleene_and(list(factors.values()))
+    return DECISION[verdict], factors, 1.0 if verdict == TRUE else 0.0
+
+
+def evaluate_many(candidates, logical_now, provenance=None):
+    """Columnar evaluate(): each factor runs over the whole batch before the
+    next one starts. Returns one (decision, factors, por) per candidate."""
+    if METRICS is not None:
+        cols = tuple(_column_timed(k, candidates, logical_now, METRICS,
+                                   provenance)
+                     for k in _FACTOR_KEYS)
+    else:
+        cols = (
+            [factor_A_attestation(c) for c in candidates],
+            [factor_R_resonance(c) for c in candidates],
+            [factor_P_provenance(c, provenance) for c in candidates],
+            [factor_F_freshness(c, logical_now) for c in candidates],
+        )
+    out = []
+    for a, r, p, f in zip(*cols):
+        verdict = kleene_and((a, r, p, f))
+        # PoR is 1.0 exactly when every factor is TRUE, i.e. verdict is TRUE
+        out.append((DECISION[verdict], {"A": a, "R": r, "P": p, "F": f},
+                    1.0 if verdict == TRUE else 0.0))
+    return out
+
+
+def _column_timed(key, candidates, logical_now, m, provenance=None):
+    t = m.clock()
+    col = [evaluate_factor(key, c, logical_now, provenance) for c in candidates]
+    mean = (m.clock() - t) / max(1, len(col))
+    for v in (TRUE, FALSE, UNKNOWN):
+        n = col.count(v)
+        if n:
+            m.factor(key, v, mean, n)
+    return col
+
+
+# --- lazy, cost-aware evaluation ---------------------------------------------
+class FactorPlanner:
+    """Per-factor cost and refusal statistics, and the order lazy evaluation
+    uses. The order only changes when replan() is called, and every lazy
+    receipt records it, so replay stays deterministic."""
+
+    def __init__(self, order=("F", "R", "P", "A")):   # cheap first, HMAC last
+        if sorted(order) != sorted(_FACTOR_KEYS):
+            raise ValueError(f"order must be a permutation of {_FACTOR_KEYS}, "
+                             f"got {tuple(order)}")
+        self.order = tuple(order)
+        self.seconds = dict.fromkeys(_FACTOR_KEYS, 0.0)
+        self.calls = dict.fromkeys(_FACTOR_KEYS, 0)
+        self.false = dict.fromkeys(_FACTOR_KEYS, 0)
+
+    def observe(self, key, falses, seconds, n=1):
+        self.seconds[key] += seconds
+        self.calls[key] += n
+        self.false[key] += falses
+
+    def replan(self):
+        """Sort by mean cost per expected refusal (cost / P(FALSE), with a
+        Laplace prior), so cheap, selective factors run first."""
+        def rank(k):
+            calls = self.calls[k]
+            mean = self.seconds[k] / calls if calls else 0.0
+            return mean * (calls + 2) / (self.false[k] + 1)
+        self.order = tuple(sorted(self.order, key=rank))
+        return self.order
+
+
+def _lazy_verdict(factors):
+    """kleene_and() over a lazy row. SKIPPED reads as TRUE there, so it is
+    only lawful next to the FALSE that stopped evaluation."""
+    values = list(factors.values())
+    if SKIPPED in values and FALSE not in values:
+        raise AssertionError(f"factors skipped without a FALSE: {factors}")
+    verdict = kleene_and(values)
+    return DECISION[verdict], factors, 1.0 if verdict == TRUE else 0.0
+
+
+def evaluate_lazy(candidate, logical_now, planner, provenance=None):
+    """evaluate() in planner order, stopping at the first FALSE: the verdict
+    can no longer change, so the remaining factors are marked SKIPPED."""
+    m = METRICS
+    factors = dict.fromkeys(_FACTOR_KEYS, SKIPPED)
+    for k in planner.order:
+        t = time.perf_counter()
+        factors[k] = v = evaluate_factor(k, candidate, logical_now, provenance)
+        dt = time.perf_counter() - t
+        planner.observe(k, v == FALSE, dt)
+        if m is not None:
+            m.factor(k, v, dt)
+        if v == FALSE:
+            break
+    return _lazy_verdict(factors)
+
+
+def evaluate_many_lazy(candidates, logical_now, planner, provenance=None):
+    """Columnar evaluate_lazy(): each factor column only runs over the
+    candidates that no earlier column has refused."""
+    m = METRICS
+    rows = [dict.fromkeys(_FACTOR_KEYS, SKIPPED) for _ in candidates]
+    live = list(range(len(candidates)))
+    for k in planner.order:
+        t = time.perf_counter()
+        col = [evaluate_factor(k, candidates[i], logical_now, provenance)
+               for i in live]
+        dt = time.perf_counter() - t
+        falses = col.count(FALSE)
+        if live:
+            planner.observe(k, falses, dt, len(live))
+            if m is not None:
+                for v in (TRUE, FALSE, UNKNOWN):
+                    n = col.count(v)
+                    if n:
+                        m.factor(k, v, dt / len(live), n)
+        for i, v in zip(live, col):
+            rows[i][k] = v
+        if falses:
+            live = [i for i, v in zip(live, col) if v != FALSE]
+    return [_lazy_verdict(factors) for factors in rows]
+
+
 def merit_delta(decision, por, refusal_credit=0.5):
     """Proof-of-Resonance over the gate itself: a correct refusal accrues
     measurable merit rather than reading as pure cost."""
@@ -119,48 +404,815 @@ def canon(obj):
     return json.dumps(obj, sort_keys=True, separators=(",", ":"))
 
 
-def emit_receipt(candidate, decision, factors, por, merit, prev_id):
+# Candidates whose payload looks bigger than this are hashed by stream_hash()
+# instead of through one canon() string.
+STREAM_BYTES = 1 << 20
+_STREAM_CHUNK = 1 << 16                   # chars per string slice / hash update
+_encode_str = json.encoder.encode_basestring_ascii
+_FLAT = frozenset((str, int, float, bool, type(None)))
+_SCALAR = _FLAT - {str}
+_WALK_ITEMS = 64                          # nested items _looks_large() walks
+
+
+def _str_chars(items, limit):
+    """Total length of items if all are str and it is at most limit, else
+    None. Both checks run in C: sum() over len() bounds the total before
+    join() allocates it and raises TypeError on the first non-str."""
+    try:
+        n = sum(map(len, items))
+        if n <= limit:
+            "".join(items)
+            return n
+    except TypeError:
+        pass
+    return None
+
+
+def _looks_large(obj):
+    """Cheap size estimate: string lengths and ~16 bytes per nested item at
+    the top level, then a walk of at most _WALK_ITEMS nested items for
+    strings hidden below (e.g. {"evidence": [big]}). Longer nested lists
+    are sized by _str_chars() when they hold only strings (provenance
+    chains); anything else past the cap is streamed rather than walked."""
+    if type(obj) is not dict:
+        return False
+    size, stack = 0, []
+    for k, v in obj.items():
+        if type(k) is str:
+            size += len(k)
+        t = type(v)
+        if t is str:
+            size += len(v)
+        elif t is list or t is dict or t is tuple:
+            size += len(v) << 4
+            stack.append(v)
+    budget = _WALK_ITEMS
+    while stack and size <= STREAM_BYTES:
+        cur = stack.pop()
+        if len(cur) > budget:             # too many items to walk one by one
+            if type(cur) is dict:
+                return True
+            n = _str_chars(cur, STREAM_BYTES - size)
+            if n is None:
+                return True
+            size += n
+            continue
+        budget -= len(cur)
+        for v in (cur.values() if type(cur) is dict else cur):
+            t = type(v)
+            if t is str:
+                size += len(v)
+            elif t is list or t is dict or t is tuple:
+                stack.append(v)
+        if type(cur) is dict:
+            size += sum(len(k) for k in cur if type(k) is str)
+    return size > STREAM_BYTES
+
+
+def _canon_chunks(obj):
+    """canon(obj) as a sequence of str pieces, walked in sorted-key order;
+    long strings are escaped slice by slice, so no piece is longer than a
+    slice no matter how big obj is."""
+    if isinstance(obj, str):
+        if len(obj) <= _STREAM_CHUNK:
+            yield json.dumps(obj)
+            return
+        yield '"'
+        for i in range(0, len(obj), _STREAM_CHUNK):
+            # ensure_ascii escapes char by char, so slices escape independently
+            yield _encode_str(obj[i:i + _STREAM_CHUNK])[1:-1]
+        yield '"'
+    elif isinstance(obj, dict):
+        yield "{"
+        first, run = True, {}
+        for k, v in sorted(obj.items()):
+            if not isinstance(k, (str, int, float, type(None))):
+                raise TypeError(f"keys must be str, int, float, bool or None, "
+                                f"not {type(k).__name__}")
+            t = type(v)
+            if t in _SCALAR or (t is str and len(v) <= _STREAM_CHUNK):
+                run[k] = v                # short members: one C-encoded run
+                continue
+            if run:
+                yield ("" if first else ",") + canon(run)[1:-1]
+                first, run = False, {}
+            yield ("" if first else ",") + json.dumps(
+                k if isinstance(k, str) else json.dumps(k)) + ":"
+            first = False
+            yield from _canon_chunks(v)
+        if run:
+            yield ("" if first else ",") + canon(run)[1:-1]
+        yield "}"
+    elif isinstance(obj, (list, tuple)):
+        yield "["
+        step = 1024
+        for i in range(0, len(obj), step):
+            if i:
+                yield ","
+            part = obj[i:i + step]
+            if (_str_chars(part, len(part) << 8) is not None
+                    or set(map(type, part)) <= _SCALAR):
+                yield canon(part)[1:-1]   # short scalars: one C-encoded slice
+                continue
+            for j, v in enumerate(part):
+                if j:
+                    yield ","
+                yield from _canon_chunks(v)
+        yield "]"
+    else:                                 # numbers, bools, None
+        yield json.dumps(obj)
+
+
+def stream_hash(obj):
+    """(sha256 of canon(obj), canonical byte count) without ever holding
+    canon(obj): pieces are buffered up to _STREAM_CHUNK chars per update()."""
+    h = hashlib.sha256()
+    buf, held, total = [], 0, 0
+    for piece in _canon_chunks(obj):
+        buf.append(piece)
+        held += len(piece)
+        if held >= _STREAM_CHUNK:
+            h.update("".join(buf).encode())
+            total += held
+            buf, held = [], 0
+    h.update("".join(buf).encode())
+    return h, total + held
+
+
+def input_digest(candidate):
+    if METRICS is not None:
+        return _digest_timed("input", candidate, METRICS)
+    if _looks_large(candidate):
+        return stream_hash(candidate)[0].hexdigest()
+    return hashlib.sha256(canon(candidate).encode()).hexdigest()
+
+
+def _digest_timed(kind, obj, m):
+    t = m.clock()
+    if _looks_large(obj):
+        h, n = stream_hash(obj)
+        digest = h.hexdigest()
+    else:
+        data = canon(obj).encode()
+        digest, n = hashlib.sha256(data).hexdigest(), len(data)
+    m.canonical(kind, n, m.clock() - t)
+    return digest
+
+
+def emit_receipt(candidate, decision, factors, por, merit, prev_id,
+                 resolves=None, digest=None, order=None):
     content = {
         "protocol": PROTOCOL_ID,
         "version": VERSION,
-        "input_digest": hashlib.sha256(canon(candidate).encode()).hexdigest(),
+        "input_digest": input_digest(candidate) if digest is None else digest,
         "factors": factors,
         "decision": decision,
         "por": por,
         "merit_delta": merit,
         "prev_receipt_id": prev_id,
     }
-    rid = hashlib.sha256(canon(content).encode()).hexdigest()
-    return {"receipt_id": rid, "content": content}
+    if resolves is not None:              # follow-up to a held VEILED receipt
+        content["resolves"] = resolves
+    if order is not None:                 # lazy evaluation order, e.g. "FRPA"
+        content["order"] = order
+    return {"receipt_id": receipt_id(content), "content": content}
+
+
+def receipt_id(content):
+    if METRICS is not None:
+        return _digest_timed("receipt", content, METRICS)
+    h = RECEIPT_ENCODER.hash(content)
+    return h.hexdigest() if h is not None else hashlib.sha256(
+        canon(content).encode()).hexdigest()
+
+
+class ReceiptEncoder:
+    """canon() for receipt contents, fed to SHA-256 piece by piece in the
+    order sort_keys would write the keys. The leading decision + factors
+    bytes are the same for every receipt with the same verdict (at most
+    4**4 factor dicts), so the hash state after them is cached and copied;
+    the protocol header is encoded once. Anything that is not a plain
+    receipt shape returns None and the caller falls back to canon()."""
+
+    def __init__(self, max_prefixes=4096):
+        self.max_prefixes = max_prefixes
+        self._prefixes = {}               # (decision, factor items) -> sha256
+        self._tail = (f',"protocol":{json.dumps(PROTOCOL_ID)}'.encode(),
+                      f',"version":{json.dumps(VERSION)}}}'.encode())
+
+    def _prefix(self, decision, factors):
+        key = (decision, tuple(factors.items()))
+        h = self._prefixes.get(key)
+        if h is None:
+            if type(decision) is not str or not all(
+                    type(k) is str and type(v) is str for k, v in key[1]):
+                return None
+            h = hashlib.sha256(b'{"decision":' + json.dumps(decision).encode()
+                               + b',"factors":' + canon(factors).encode()
+                               + b',"input_digest":')
+            if len(self._prefixes) >= self.max_prefixes:
+                self._prefixes.clear()
+            self._prefixes[key] = h
+        return h
+
+    @staticmethod
+    def _scalar(x):
+        if x is None:
+            return b"null"
+        t = type(x)
+        if t is str:
+            if x.isalnum() and x.isascii():   # ids, digests: nothing to escape
+                return b'"' + x.encode() + b'"'
+            return json.dumps(x).encode()
+        if t is float or t is int:
+            r = repr(x)
+            if r[-1].isdigit():           # json writes nan/inf differently
+                return r.encode()
+        return None
+
+    def hash(self, content):
+        if type(content) is not dict:
+            return None
+        scalar = self._scalar
+        try:
+            if (content["protocol"] != PROTOCOL_ID
+                    or content["version"] != VERSION):
+                return None
+            factors = content["factors"]
+            prefix = (self._prefix(content["decision"], factors)
+                      if type(factors) is dict else None)
+            parts = (scalar(content["input_digest"]),
+                     scalar(content["merit_delta"]),
+                     scalar(content["por"]),
+                     scalar(content["prev_receipt_id"]))
+        except (KeyError, TypeError, AttributeError):
+            return None
+        n = 8
+        order = resolves = b""
+        if "order" in content:
+            n += 1
+            order = scalar(content["order"])
+            if order is None:
+                return None
+            order = b',"order":' + order
+        if "resolves" in content:
+            n += 1
+            resolves = scalar(content["resolves"])
+            if resolves is None:
+                return None
+            resolves = b',"resolves":' + resolves
+        if len(content) != n or prefix is None or None in parts:
+            return None
+        h = prefix.copy()
+        h.update(parts[0] + b',"merit_delta":' + parts[1] + order
+                 + b',"por":' + parts[2] + b',"prev_receipt_id":' + parts[3])
+        h.update(self._tail[0] + resolves + self._tail[1])
+        return h
+
+
+RECEIPT_ENCODER = ReceiptEncoder()
+
+
+# --- Merkle mountain range over receipt ids ----------------------------------
+def _mmr_leaf(rid):
+    return hashlib.sha256(b"\x00" + bytes.fromhex(rid)).digest()
+
+
+def _mmr_node(left, right):
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _mmr_bag(peaks):
+    """Fold the peaks right to left into one root."""
+    if not peaks:
+        return hashlib.sha256(b"").hexdigest()
+    root = peaks[-1]
+    for p in reversed(peaks[:-1]):
+        root = _mmr_node(p, root)
+    return root.hex()
+
+
+class MerkleMountainRange:
+    """Append-only MMR. levels[h][j] is the root of the perfect subtree over
+    leaves [j * 2**h, (j + 1) * 2**h); a node exists only once complete, so
+    the peaks are the unpaired last node of each level."""
+
+    def __init__(self, prune=False):
+        self.levels = [[]]
+        self.sizes = [0]                  # nodes ever appended per level
+        self.prune = prune                # keep peaks only: root, no proofs
+
+    @classmethod
+    def from_peaks(cls, sizes, peaks):
+        """A pruned MMR resumed from its level sizes and peaks (highest level
+        first, as peaks() returns them): root() is exact, no proofs."""
+        mmr = cls(prune=True)
+        mmr.sizes = list(sizes)
+        mmr.levels = [[] for _ in mmr.sizes]
+        it = iter(peaks)
+        for h in reversed(range(len(mmr.sizes))):
+            if mmr.sizes[h] % 2:
+                mmr.levels[h].append(next(it))
+        return mmr
+
+    def __len__(self):
+        return self.sizes[0]
+
+    def append(self, rid):
+        """Add one leaf; returns the nodes it created, leaf first (the order
+        a receipt log persists them in)."""
+        node, h = _mmr_leaf(rid), 0
+        self.levels[0].append(node)
+        self.sizes[0] += 1
+        created = [node]
+        while self.sizes[h] % 2 == 0:
+            node = _mmr_node(self.levels[h][-2], node)
+            created.append(node)
+            if self.prune:                # a completed pair is never read again
+                self.levels[h].clear()
+            h += 1
+            if h == len(self.levels):
+                self.levels.append([])
+                self.sizes.append(0)
+            self.levels[h].append(node)
+            self.sizes[h] += 1
+        return created
+
+    def peaks(self):
+        return [self.levels[h][-1] for h in reversed(range(len(self.levels)))
+                if self.sizes[h] % 2]
+
+    def root(self):
+        return _mmr_bag(self.peaks())
+
+    def proof(self, index):
+        """Sibling path from leaf `index` up to its peak, plus every peak."""
+        if self.prune:
+            raise LookupError("pruned MMR keeps peaks only; older proofs "
+                              "need the receipt log (ReceiptLog.inclusion_proof)")
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        path, h, j = [], 0, index
+        while j ^ 1 < len(self.levels[h]):
+            path.append(["L" if j & 1 else "R", self.levels[h][j ^ 1].hex()])
+            h, j = h + 1, j >> 1
+        peaks = self.peaks()
+        return {"index": index, "path": path,
+                "peak": peaks.index(self.levels[h][j]),
+                "peaks": [p.hex() for p in peaks]}
+
+
+def verify_inclusion(receipt, proof, root):
+    """Check one receipt against an MMR root in O(log n) hashes: the receipt
+    id must match its content, hash up the path to the named peak, and the
+    peaks must bag to root."""
+    if receipt_id(receipt["content"]) != receipt["receipt_id"]:
+        return False
+    node = _mmr_leaf(receipt["receipt_id"])
+    for side, sibling in proof["path"]:
+        sibling = bytes.fromhex(sibling)
+        node = _mmr_node(sibling, node) if side == "L" else _mmr_node(node, sibling)
+    peaks = [bytes.fromhex(p) for p in proof["peaks"]]
+    return (0 <= proof["peak"] < len(peaks) and peaks[proof["peak"]] == node
+            and _mmr_bag(peaks) == root)
+
+
+# --- gate snapshots ------------------------------------------------------------
+# magic, merit, receipt count, logical clock, log segment, log offset, head,
+# MMR level count, peak count; then the MMR level sizes (Q each), the peaks
+# (32 bytes each), the effects as length-prefixed canonical JSON, and a
+# SHA-256 trailer over everything before it.
+_SNAPSHOT_MAGIC = b"EAAPSNP1"
+_SNAPSHOT = struct.Struct(">8sdQqIQ32sHH")
+_NO_CLOCK = -(1 << 63)
+_GENESIS_HEAD = bytes(32)
+
+
+# --- compact receipts ----------------------------------------------------------
+_FACTOR_CODE = {SKIPPED: 0, TRUE: 1, FALSE: 2, UNKNOWN: 3}
+_FACTOR_VALUE = {v: k for k, v in _FACTOR_CODE.items()}
+_DECISIONS = ("BIND", "REFUSE", "VEILED")
+
+
+def _pack_id(rid):
+    return bytes.fromhex(rid) if len(rid) == 64 else rid    # GENESIS stays text
+
+
+def _unpack_id(rid):
+    return rid.hex() if isinstance(rid, bytes) else rid
+
+
+class CompactReceipt:
+    """A receipt held as raw 32-byte digests plus one small int packing the
+    four factors (2 bits each) and the decision. PROTOCOL_ID/VERSION are not
+    stored. Reads like the dict form (r["receipt_id"], r["content"]), which
+    is rendered on demand."""
+
+    __slots__ = ("rid", "prev", "input_digest", "code", "por", "merit_delta",
+                 "resolves", "order")
+
+    def __init__(self, receipt):
+        content = receipt["content"]
+        code = _DECISIONS.index(content["decision"]) << 8
+        for i, k in enumerate(_FACTOR_KEYS):
+            code |= _FACTOR_CODE[content["factors"][k]] << (2 * i)
+        self.rid = bytes.fromhex(receipt["receipt_id"])
+        self.prev = _pack_id(content["prev_receipt_id"])
+        self.input_digest = bytes.fromhex(content["input_digest"])
+        self.code = code
+        self.por = content["por"]
+        self.merit_delta = content["merit_delta"]
+        resolves = content.get("resolves")
+        self.resolves = None if resolves is None else bytes.fromhex(resolves)
+        self.order = content.get("order")
+
+    @property
+    def receipt_id(self):
+        return self.rid.hex()
+
+    @property
+    def decision(self):
+        return _DECISIONS[self.code >> 8]
+
+    @property
+    def factors(self):
+        return {k: _FACTOR_VALUE[(self.code >> (2 * i)) & 3]
+                for i, k in enumerate(_FACTOR_KEYS)}
+
+    @property
+    def content(self):
+        content = {
+            "protocol": PROTOCOL_ID,
+            "version": VERSION,
+            "input_digest": self.input_digest.hex(),
+            "factors": self.factors,
+            "decision": self.decision,
+            "por": self.por,
+            "merit_delta": self.merit_delta,
+            "prev_receipt_id": _unpack_id(self.prev),
+        }
+        if self.resolves is not None:
+            content["resolves"] = self.resolves.hex()
+        if self.order is not None:
+            content["order"] = self.order
+        return content
+
+    def to_dict(self):
+        return {"receipt_id": self.receipt_id, "content": self.content}
+
+    def __getitem__(self, key):
+        if key == "receipt_id":
+            return self.receipt_id
+        if key == "content":
+            return self.content
+        raise KeyError(key)
 
 
 class Gate:
-    """The boundary. Nothing executes except through submit()."""
+    """The boundary. Nothing executes except through submit() (or resolve()
+    of a held VEILED submission, which is the same path)."""
 
     GENESIS = "GENESIS"
 
-    def __init__(self):
+    def __init__(self, log=None, checkpoint_every=0, compact=False, window=None,
+                 hold_veiled=False, nonces=None, ledger=None, dedupe=0,
+                 lazy=None, index=None, provenance=None, max_held=65536,
+                 kernel=None):
         self.head = self.GENESIS
-        self.receipts = []
+        # window=N keeps only the N most recent receipts in memory (the log,
+        # if any, holds the rest); compact=True stores them as CompactReceipt
+        self.receipts = [] if window is None else deque(maxlen=window)
+        self.compact = compact
         self.effects = []                 # side effects that ACTUALLY fired
         self.merit = 0.0
+        self.count = 0                    # receipts ever chained, incl. recovered
+        self.logical_now = None           # logical clock of the last submission
+        self.log = log                    # optional durable log (eaap_log)
+        # inclusion proofs over receipt ids; a windowed or log-backed gate
+        # keeps peaks only (the log recovers them from its tail segment)
+        self.mmr = MerkleMountainRange(prune=window is not None)
+        if log is not None:
+            self.head, self.merit, self.effects, self.count = log.recover()
+            self.mmr = MerkleMountainRange.from_peaks(log.mmr.sizes,
+                                                      log.mmr.peaks())
+        self.checkpoint_every = checkpoint_every
+        self.hold_veiled = hold_veiled    # keep VEILED candidates for resolve()
+        self.max_held = max_held          # oldest held candidate is dropped
+        self.held = {}                    # VEILED receipt id -> held evaluation
+        self.nonces = nonces              # optional replay index (eaap_nonce)
+        self.ledger = ledger              # optional per-actor merit (eaap_ledger)
+        # dedupe=N: a resubmission whose input_digest is among the last N
+        # admitted gets the original receipt back; the chain is untouched
+        self.dedupe = dedupe
+        self._recent = OrderedDict()      # input_digest -> receipt
+        self.lazy = lazy                  # FactorPlanner: skip after a FALSE
+        self.index = index                # optional audit index (eaap_index)
+        self.provenance = provenance      # ProvenanceStore for `provenance` ids
+        self.kernel = kernel              # e.g. eaap_kernel: batch evaluation
+        self.checkpoints = [self.checkpoint()] if checkpoint_every else []
+
+    def checkpoint(self):
+        """The chain position now: enough to resume replay from here."""
+        return {"index": self.count, "head": self.head, "merit": self.merit,
+                "effects": len(self.effects)}
+
+    def snapshot(self, path):
+        """Write head, merit, effects, logical clock, receipt-log position
+        and MMR peaks to a compact binary file (atomically replaced). Held
+        candidates, the dedupe index and in-memory receipts are not kept."""
+        segment, offset = self.log.position() if self.log is not None else (0, 0)
+        head = _GENESIS_HEAD if self.head == self.GENESIS else bytes.fromhex(self.head)
+        clock = _NO_CLOCK if self.logical_now is None else self.logical_now
+        peaks = self.mmr.peaks()
+        effects = canon(self.effects).encode()
+        data = b"".join([
+            _SNAPSHOT.pack(_SNAPSHOT_MAGIC, self.merit, self.count, clock,
+                           segment, offset, head, len(self.mmr.sizes),
+                           len(peaks)),
+            struct.pack(f">{len(self.mmr.sizes)}Q", *self.mmr.sizes),
+            *peaks,
+            struct.pack(">I", len(effects)), effects,
+        ])
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(data + hashlib.sha256(data).digest())
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+
+    @classmethod
+    def restore(cls, path, log=None, **opts):
+        """A gate resumed from snapshot() in constant time, without replay.
+        Its MMR holds peaks only, so root() is exact but older inclusion
+        proofs come from the log. With a log, the log must sit exactly at
+        the snapshot's position."""
+        with open(path, "rb") as fh:
+            data = fh.read()
+        body, digest = data[:-32], data[-32:]
+        if hashlib.sha256(body).digest() != digest:
+            raise ValueError(f"{path}: snapshot checksum mismatch")
+        (magic, merit, count, clock, segment, offset, head, nlevels,
+         npeaks) = _SNAPSHOT.unpack_from(body)
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError(f"{path}: not a gate snapshot")
+        pos = _SNAPSHOT.size
+        sizes = list(struct.unpack_from(f">{nlevels}Q", body, pos))
+        pos += 8 * nlevels
+        peaks = [body[pos + 32 * i:pos + 32 * (i + 1)] for i in range(npeaks)]
+        pos += 32 * npeaks
+        (n,) = struct.unpack_from(">I", body, pos)
+        effects = json.loads(body[pos + 4:pos + 4 + n])
+
+        g = cls(**opts)
+        g.head = cls.GENESIS if head == _GENESIS_HEAD else head.hex()
+        g.merit, g.count, g.effects = merit, count, effects
+        g.logical_now = None if clock == _NO_CLOCK else clock
+        g.mmr = MerkleMountainRange.from_peaks(sizes, peaks)
+        if g.checkpoint_every:
+            g.checkpoints = [g.checkpoint()]
+        if log is not None:
+            if log.position() != (segment, offset) or log.count != count:
+                raise ValueError(f"{path}: receipt log has moved past the snapshot")
+            g.log = log
+        return g
+
+    def root(self):
+        """MMR root over every receipt id chained so far."""
+        return self.mmr.root()
+
+    def inclusion_proof(self, index):
+        """MMR inclusion proof for receipt `index`; a pruned gate with a
+        receipt log proves from the nodes the log persists."""
+        if self.mmr.prune and self.log is not None:
+            return self.log.inclusion_proof(index)
+        return self.mmr.proof(index)
+
+    verify_inclusion = staticmethod(verify_inclusion)
 
     def submit(self, candidate, logical_now):
-        decision, factors, por = evaluate(candidate, logical_now)
+        if METRICS is not None:
+            t = METRICS.clock()
+            receipt = self._submit(candidate, logical_now)
+            METRICS.observe("submit", METRICS.clock() - t)
+            return receipt
+        return self._submit(candidate, logical_now)
+
+    def _submit(self, candidate, logical_now):
+        digest = None
+        if self.dedupe:
+            digest = input_digest(candidate)
+            if digest in self._recent:    # client retry: same answer, O(1)
+                return self._recent[digest]
+        decision, factors, por = self.evaluate(candidate, logical_now)
+        return self._admit(candidate, decision, factors, por, logical_now,
+                           digest)
+
+    def submit_many(self, candidates, logical_now):
+        """Batched submit(). Factors are evaluated column by column, then the
+        chain is folded in submission order, so every receipt id is
+        byte-identical to calling submit() once per candidate."""
+        candidates = list(candidates)
+        if METRICS is not None:
+            t = METRICS.clock()
+            out = self._submit_many(candidates, logical_now)
+            METRICS.observe("submit_many", (METRICS.clock() - t)
+                            / max(1, len(candidates)), len(candidates))
+        else:
+            out = self._submit_many(candidates, logical_now)
+        if self.index is not None:        # one index transaction per batch
+            self.index.flush()
+        return out
+
+    def _submit_many(self, candidates, logical_now):
+        if not self.dedupe:
+            return [self._admit(c, decision, factors, por, logical_now)
+                    for c, (decision, factors, por)
+                    in zip(candidates, self.evaluate_many(candidates, logical_now))]
+        digests = [input_digest(c) for c in candidates]
+        first = {}                        # digest -> first position in batch
+        for i, d in enumerate(digests):
+            if d not in self._recent:
+                first.setdefault(d, i)
+        evaluated = dict(zip(first, self.evaluate_many(
+            [candidates[i] for i in first.values()], logical_now)))
+        out = []
+        for c, d in zip(candidates, digests):
+            # the window moves as the fold admits, exactly as under submit()
+            if d in self._recent:
+                out.append(self._recent[d])
+                continue
+            if d not in evaluated:        # was known, has left the window
+                evaluated[d] = self.evaluate(c, logical_now)
+            out.append(self._admit(c, *evaluated[d], logical_now, d))
+        return out
+
+    def evaluate(self, candidate, logical_now):
+        if self.lazy is not None:
+            return evaluate_lazy(candidate, logical_now, self.lazy,
+                                 self.provenance)
+        return evaluate(candidate, logical_now, self.provenance)
+
+    def evaluate_many(self, candidates, logical_now):
+        if self.lazy is not None:
+            return evaluate_many_lazy(candidates, logical_now, self.lazy,
+                                      self.provenance)
+        if self.kernel is not None and METRICS is None:
+            return self.kernel.evaluate_many(candidates, logical_now,
+                                             self.provenance)
+        return evaluate_many(candidates, logical_now, self.provenance)
+
+    def _admit(self, candidate, decision, factors, por, logical_now,
+               digest=None):
+        if self.nonces is not None:
+            decision, factors, por = self._check_replay(candidate, factors,
+                                                        logical_now)
+        receipt = self._commit(candidate, decision, factors, por, logical_now,
+                               digest=digest)
+        if self.dedupe:
+            self._recent[digest] = receipt
+            if len(self._recent) > self.dedupe:
+                self._recent.popitem(last=False)
+        return receipt
+
+    def _check_replay(self, candidate, factors, logical_now):
+        """An attested (actor, nonce) pair already seen fails A: the
+        signature is genuine but the submission is a replay."""
+        if factors["A"] == TRUE and self.nonces.seen(
+                candidate["actor"], candidate["nonce"], logical_now):
+            factors = {**factors, "A": FALSE}
+        verdict = kleene_and(list(factors.values()))
+        return DECISION[verdict], factors, 1.0 if verdict == TRUE else 0.0
+
+    def resolve(self, veiled_id, patch, logical_now):
+        """Apply an evidence patch to the candidate held under its VEILED
+        receipt id. The factors that were UNKNOWN are re-evaluated, and F
+        always is, since freshness depends on logical_now rather than on
+        evidence; the other decided factors are not re-tested, so the patch
+        may only add fields the UNKNOWN factors read and may not overwrite
+        anything already on the candidate (ValueError otherwise; the
+        candidate stays held). The follow-up receipt's input_digest covers
+        the patch alone and its `resolves` field names the original VEILED
+        receipt. Still VEILED after the patch: the candidate stays held
+        under the same id."""
+        held = self.held[veiled_id]
+        allowed = {f for k, v in held["factors"].items() if v == UNKNOWN
+                   for f in FACTOR_FIELDS[k]}
+        bad = sorted(k for k in patch
+                     if k not in allowed or k in held["candidate"])
+        if bad:
+            raise ValueError(f"{veiled_id}: patch may not set {bad}")
+        del self.held[veiled_id]
+        subject = {**held["candidate"], **patch}
+        factors = {k: evaluate_factor(k, subject, logical_now, self.provenance)
+                   if v == UNKNOWN or k == "F" else v
+                   for k, v in held["factors"].items()}
+        if self.nonces is not None and held["factors"]["A"] == UNKNOWN:
+            decision, factors, por = self._check_replay(subject, factors,
+                                                        logical_now)
+        else:
+            verdict = kleene_and(list(factors.values()))
+            decision, por = DECISION[verdict], 1.0 if verdict == TRUE else 0.0
+        return self._commit(patch, decision, factors, por, logical_now,
+                            subject=subject, resolves=held["receipt_id"])
+
+    def _commit(self, candidate, decision, factors, por, logical_now,
+                subject=None, resolves=None, digest=None):
+        # `subject` is the full candidate the decision is about; it differs
+        # from the hashed `candidate` only for resolve() follow-ups
+        subject = candidate if subject is None else subject
+        self.logical_now = logical_now
         merit = merit_delta(decision, por)
-        receipt = emit_receipt(candidate, decision, factors, por, merit, self.head)
+        if METRICS is not None:
+            METRICS.decision(decision)
+        order = None if self.lazy is None else "".join(self.lazy.order)
+        receipt = emit_receipt(candidate, decision, factors, por, merit,
+                               self.head, resolves, digest, order)
+        effect = subject.get("id") if decision == "BIND" else None
+        # the log write is the first state change and the only step that may
+        # raise; everything after it cannot, so gate and log never disagree
+        if self.log is not None:          # durable per the log's fsync_every
+            self.log.append(receipt, effect)
         if decision == "BIND":            # <-- the only path to consequence
-            self.effects.append(candidate.get("id"))
+            self.effects.append(effect)
+        elif decision == "VEILED" and self.hold_veiled:
+            veiled_id = resolves or receipt["receipt_id"]
+            self.held[veiled_id] = {"candidate": subject, "factors": factors,
+                                    "receipt_id": veiled_id}
+            if len(self.held) > self.max_held:
+                del self.held[next(iter(self.held))]
         self.merit += merit
         self.head = receipt["receipt_id"]
-        self.receipts.append(receipt)
+        self.receipts.append(CompactReceipt(receipt) if self.compact else receipt)
+        self.mmr.append(receipt["receipt_id"])
+        self.count += 1
+        if self.ledger is not None:       # accrues at the gate's logical clock
+            self.ledger.add(subject.get("actor"), logical_now, merit)
+        if self.index is not None:
+            self.index.add(self.count - 1, receipt, subject)
+        if self.checkpoint_every and self.count % self.checkpoint_every == 0:
+            self.checkpoints.append(self.checkpoint())
+            if self.log is not None:      # lets auditors split the log
+                self.log.checkpoint(self.checkpoints[-1])
         return receipt
 
 
+def verify_from(checkpoint, candidates, target, logical_now=100,
+                provenance=None):
+    """Incremental replay: resume at `checkpoint`, submit only the inputs that
+    follow it (candidates[checkpoint index:], in order) and confirm the chain
+    lands exactly on `target`, normally the next checkpoint. Candidates that
+    carry `provenance` ids replay against the `provenance` store given."""
+    g = Gate(provenance=provenance)
+    g.head, g.merit = checkpoint["head"], checkpoint["merit"]
+    g.count = checkpoint["index"]
+    for c in itertools.islice(candidates, target["index"] - checkpoint["index"]):
+        g.submit(c, logical_now)
+    reached = g.checkpoint()
+    reached["effects"] += checkpoint["effects"]
+    return reached == target
+
+
+def locate_divergence(a, b):
+    """Find the first receipt at which two chains part ways (e.g. a chain and
+    its replay), in O(log n) head comparisons: bisect the shared checkpoint
+    heads, then the receipt ids inside the first diverging segment. Both
+    gates must hold their receipts from index 0. Returns None when the
+    chains agree, else {"index": i, "fields": [...]} naming the content
+    fields (factors as "factors.R" etc.) that differ at receipt i; fields is
+    empty when one chain simply ends there."""
+    heads_b = {cp["index"]: cp["head"] for cp in b.checkpoints}
+    shared = [cp for cp in a.checkpoints if cp["index"] in heads_b]
+    n = min(len(a.receipts), len(b.receipts))
+    lo, hi = -1, len(shared)              # shared[lo] agrees, shared[hi] differs
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if heads_b[shared[mid]["index"]] == shared[mid]["head"]:
+            lo = mid
+        else:
+            hi = mid
+    start = shared[lo]["index"] if lo >= 0 else 0
+    end = min(shared[hi]["index"], n) if hi < len(shared) else n
+    while start < end:                    # first differing receipt id
+        mid = (start + end) // 2
+        if a.receipts[mid]["receipt_id"] == b.receipts[mid]["receipt_id"]:
+            start = mid + 1
+        else:
+            end = mid
+    if start == n:
+        return None if len(a.receipts) == len(b.receipts) else {"index": n, "fields": []}
+    ca, cb = a.receipts[start]["content"], b.receipts[start]["content"]
+    fields = []
+    for k in sorted(ca.keys() | cb.keys()):
+        if k == "factors":
+            fields += [f"factors.{f}" for f in sorted(ca[k]) if ca[k][f] != cb[k].get(f)]
+        elif ca.get(k) != cb.get(k):
+            fields.append(k)
+    return {"index": start, "fields": fields}
+
+
 # --- proof harness -----------------------------------------------------------
 def sign(actor, nonce):
-    return hmac.new(_ATTEST_KEY, f"{actor}|{nonce}".encode(),
-                    hashlib.sha256).hexdigest()
+    return ATTESTER.expected(actor, nonce)
 
 
 def build_candidates():
@@ -184,8 +1236,8 @@ def build_candidates():
     ]
 
 
-def run_sequence(candidates, logical_now=100):
-    g = Gate()
+def run_sequence(candidates, logical_now=100, checkpoint_every=0):
+    g = Gate(checkpoint_every=checkpoint_every)
     for c in candidates:
         g.submit(c, logical_now)
     return g
@@ -199,7 +1251,7 @@ def main():
     print(bar)
 
     candidates = build_candidates()
-    g = run_sequence(candidates)
+    g = run_sequence(candidates, checkpoint_every=2)
 
     print("\n[1] WHAT ENTERS / [2] WHAT IS TESTED / [3] WHAT ADMITS OR REFUSES")
     print(f"{'id':<4}{'A':<9}{'R':<9}{'P':<9}{'F':<9}{'PoR':<6}{'DECISION':<8}")
@@ -217,6 +1269,13 @@ def main():
     print(f"    PREVENTED : {blocked}")
     print(f"    PoR merit ledger total: {g.merit}  "
           f"(correct refusals accrue, not just cost)")
+    gh = Gate(hold_veiled=True)
+    veiled = gh.submit_many(build_candidates(), 100)[3]
+    follow = gh.resolve(veiled["receipt_id"], {"resonance": 0.90}, 100)  # late R
+    print(f"    HELD      : c4 VEILED; late evidence re-tests R (and F) -> "
+          f"{follow['content']['decision']}")
+    print(f"                follow-up resolves {follow['content']['resolves'][:8]}, "
+          f"EXECUTED {gh.effects}")
 
     print("\n[5] WHAT RECEIPT IS EMITTED  (content-addressed, hash-chained)")
     for c, r in zip(candidates, g.receipts):
@@ -224,6 +1283,10 @@ def main():
               f"receipt {r['receipt_id'][:16]}...  "
               f"prev {r['content']['prev_receipt_id'][:8]}")
     print(f"    chain head: {g.head[:16]}...")
+    proof = g.inclusion_proof(2)                     # c3 alone, without the chain
+    held = g.verify_inclusion(g.receipts[2], proof, g.root())
+    print(f"    MMR root  : {g.root()[:16]}...  c3 inclusion proof "
+          f"({len(proof['path'])} siblings, {len(proof['peaks'])} peaks): {held}")
 
     print("\n[6] WHAT REPLAY PROVES")
     g2 = run_sequence(build_candidates())            # fresh run, same inputs
@@ -231,16 +1294,28 @@ def main():
     ids2 = [r["receipt_id"] for r in g2.receipts]
     print(f"    replay reproduces every receipt id : {ids1 == ids2}")
     print(f"    replay reproduces the chain head   : {g.head == g2.head}")
+    gb = Gate()
+    gb.submit_many(build_candidates(), 100)           # columnar batch, same inputs
+    print(f"    batched submit_many reproduces head: {g.head == gb.head}")
+    cp, nxt = g.checkpoints[1], g.checkpoints[2]      # receipts 2..3 only
+    inc = verify_from(cp, build_candidates()[cp["index"]:], nxt)
+    print(f"    checkpoint replay {cp['index']}->{nxt['index']} reproduces  : {inc}")
 
     tampered = build_candidates()
     tampered[0]["resonance"] = 0.92                  # one-field mutation
-    g3 = run_sequence(tampered)
+    g3 = run_sequence(tampered, checkpoint_every=2)
     print(f"    one-field mutation diverges head   : {g.head != g3.head}")
-    print(f"      original c1 receipt: {g.receipts[0]['receipt_id'][:16]}...")
-    print(f"      tampered c1 receipt: {g3.receipts[0]['receipt_id'][:16]}...")
+    d = locate_divergence(g, g3)
+    i = d["index"]
+    print(f"      first divergent receipt: #{i} ({candidates[i]['id']}), "
+          f"changed: {', '.join(d['fields'])}")
+    print(f"      original {candidates[i]['id']} receipt: {g.receipts[i]['receipt_id'][:16]}...")
+    print(f"      tampered {candidates[i]['id']} receipt: {g3.receipts[i]['receipt_id'][:16]}...")
 
     print(f"\n{bar}")
     ok = (ids1 == ids2 and g.head == g2.head and g.head != g3.head
+          and g.head == gb.head and inc and held and i == 0
+          and follow["content"]["resolves"] == veiled["receipt_id"]
           and g.effects == ["c1"])
     print(f"PROOF SURFACE HOLDS: {ok}")
     print(bar)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  gate service
+The boundary as a long-lived local service.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only (asyncio).
+
+Clients write newline-delimited candidate JSON to a Unix or TCP socket and
+read one canonical-JSON receipt line back per candidate, in the order they
+were sent. Arrivals from every client are grouped into micro-batches (closed
+by size or by a short deadline) and passed to Gate.submit_many(), so chain
+order is the order the service dequeued them. When the pending queue is full
+readers stop reading, which pushes back on clients through the socket. A
+line longer than max_line bytes is discarded and answered with an error
+line; the connection stays up.
+
+Run:  python3 eaap_service.py --unix /tmp/eaap.sock --logical-now 100
+      python3 eaap_service.py --tcp 127.0.0.1:8700
+"""
+
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+
+from eaap_proof import Gate, canon
+
+
+class GateService:
+    """One Gate, many clients, micro-batched submission."""
+
+    def __init__(self, gate, clock, max_batch=256, max_delay=0.002,
+                 max_queue=8192, max_line=64 << 20):
+        self.gate = gate
+        self.max_line = max_line          # bytes per candidate line (stream limit)
+        self.clock = clock                # () -> logical_now for the next batch
+        self.max_batch = max_batch
+        self.max_delay = max_delay        # seconds a batch may wait to fill
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self._batcher = None
+
+    async def start(self):
+        self._batcher = asyncio.create_task(self._run_batches())
+
+    async def stop(self):
+        if self._batcher is not None:
+            self._batcher.cancel()
+
+    async def submit(self, candidate):
+        """Queue one candidate (waits while the queue is full); resolves to
+        its receipt."""
+        fut = asyncio.get_running_loop().create_future()
+        await self.queue.put((candidate, fut))
+        return await fut
+
+    async def _run_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self.queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            candidates = [c for c, _ in batch]
+            logical_now, count = self.clock(), self.gate.count
+            try:
+                # off the event loop so readers keep filling the next batch
+                receipts = await loop.run_in_executor(
+                    None, self.gate.submit_many, candidates, logical_now)
+            except Exception as exc:
+                if self.gate.count != count:   # failed mid-chain: no retry
+                    for _, fut in batch:
+                        if not fut.done():
+                            fut.set_exception(exc)
+                    continue
+                # nothing was chained: retry one at a time so only the bad
+                # candidate gets the error
+                for c, fut in batch:
+                    try:
+                        receipt = await loop.run_in_executor(
+                            None, self.gate.submit, c, logical_now)
+                    except Exception as exc:
+                        if not fut.done():
+                            fut.set_exception(exc)
+                    else:
+                        if not fut.done():
+                            fut.set_result(receipt)
+                continue
+            for (_, fut), receipt in zip(batch, receipts):
+                if not fut.done():
+                    fut.set_result(receipt)
+
+    async def handle(self, reader, writer):
+        """Per-connection loop: read lines, write receipts back in order."""
+        pending = asyncio.Queue()
+
+        async def respond():
+            while True:
+                fut = await pending.get()
+                if fut is None:
+                    break
+                try:
+                    line = canon(await fut)
+                except Exception as exc:
+                    line = canon({"error": str(exc)})
+                if writer.is_closing():       # client gone: keep draining
+                    continue
+                writer.write(line.encode() + b"\n")
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    writer.close()
+
+        responder = asyncio.create_task(respond())
+        try:
+            while True:
+                line, too_long = await _readline(reader)
+                if not line and not too_long:
+                    break
+                fut = asyncio.get_running_loop().create_future()
+                if too_long:
+                    fut.set_result({"error": "malformed candidate: line "
+                                             f"exceeds {self.max_line} bytes"})
+                    await pending.put(fut)
+                    continue
+                if not line.strip():
+                    continue
+                try:
+                    candidate = json.loads(line)
+                except ValueError as exc:
+                    fut.set_result({"error": f"malformed candidate: {exc}"})
+                else:
+                    if isinstance(candidate, dict):
+                        await self.queue.put((candidate, fut))   # backpressure
+                    else:
+                        fut.set_result({"error": "malformed candidate: "
+                                                 "expected a JSON object"})
+                await pending.put(fut)
+        except ConnectionError:
+            pass
+        finally:
+            await pending.put(None)
+            await responder
+            writer.close()
+
+
+async def _readline(reader):
+    """(line, too_long): the next line, or its remainder discarded up to the
+    newline when it overran the stream limit. (b"", False) at EOF."""
+    too_long = False
+    while True:
+        try:
+            return await reader.readuntil(b"\n"), too_long
+        except asyncio.IncompleteReadError as exc:     # EOF mid-line
+            return exc.partial, too_long
+        except asyncio.LimitOverrunError as exc:
+            too_long = True
+            await reader.readexactly(exc.consumed)     # drop what is buffered
+
+
+async def serve(service, unix=None, host=None, port=None, backlog=4096):
+    await service.start()
+    if unix is not None:
+        server = await asyncio.start_unix_server(service.handle, path=unix,
+                                                 backlog=backlog,
+                                                 limit=service.max_line)
+    else:
+        server = await asyncio.start_server(service.handle, host, port,
+                                            backlog=backlog,
+                                            limit=service.max_line)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="EAAP gate service")
+    where = ap.add_mutually_exclusive_group(required=True)
+    where.add_argument("--unix", help="Unix socket path")
+    where.add_argument("--tcp", help="host:port")
+    ap.add_argument("--logical-now", type=int, default=100)
+    ap.add_argument("--max-batch", type=int, default=256)
+    ap.add_argument("--max-delay-ms", type=float, default=2.0)
+    ap.add_argument("--max-queue", type=int, default=8192)
+    ap.add_argument("--max-line-bytes", type=int, default=64 << 20)
+    args = ap.parse_args()
+
+    service = GateService(Gate(), lambda: args.logical_now, args.max_batch,
+                          args.max_delay_ms / 1000.0, args.max_queue,
+                          args.max_line_bytes)
+    host = port = None
+    if args.tcp:
+        host, _, port = args.tcp.rpartition(":")
+        port = int(port)
+    try:
+        asyncio.run(serve(service, args.unix, host, port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
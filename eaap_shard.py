@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+ERES-EAAP-PROOFSURFACE-2026-001  sharded gate
+Independent per-shard receipt chains under one published commitment.
+
+ERES Institute for New Age Cybernetics | H2C2H | CCAL v2.1
+Python stdlib only.
+
+A single Gate.head serialises every submission. ShardedGate routes each
+candidate by the hash bucket of its `actor` to one of N Gates, each with its
+own chain; with processes=True every shard runs in its own process. After
+each batch the shard heads are folded into one combined root for the
+logical epoch, so there is still a single value to verify. Order is
+committed within a shard (hence per actor), not across shards. A
+`provenance` store in the gate options is shared by local shards but copied
+into each process shard when it starts. Stateful per-chain options (log,
+index, ledger, nonces) cannot be shared between chains: pass shard_opts, a
+function of the shard number returning that shard's own options, e.g.
+
+    def opts(n):
+        return {"log": ReceiptLog(f"receipts/{n}")}
+    ShardedGate(4, shard_opts=opts)
+
+With processes=True it runs inside each shard process, so it must be a
+picklable (module-level) function.
+"""
+
+from __future__ import annotations
+import hashlib
+import multiprocessing
+
+from eaap_proof import PROTOCOL_ID, VERSION, Gate, canon
+
+
+def shard_of(actor, shards):
+    """Stable bucket for an actor (missing actor -> bucket of "None")."""
+    digest = hashlib.sha256(str(actor).encode()).digest()
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def combined_root(heads, epoch):
+    """One commitment over every shard head at a logical epoch."""
+    return hashlib.sha256(canon({
+        "protocol": PROTOCOL_ID, "version": VERSION,
+        "epoch": epoch, "shard_heads": heads,
+    }).encode()).hexdigest()
+
+
+def _state(g):
+    return g.head, g.merit
+
+
+# options that hold one chain's state and so cannot be shared across shards
+_STATEFUL = ("log", "index", "ledger", "nonces")
+
+
+def _gate(n, gate_opts, shard_opts):
+    return Gate(**gate_opts, **({} if shard_opts is None else shard_opts(n)))
+
+
+def _serve(conn, n, gate_opts, shard_opts):
+    """Process-shard loop: one Gate, batches in, receipts and state out."""
+    g = _gate(n, gate_opts, shard_opts)
+    while True:
+        msg = conn.recv()
+        if msg is None:
+            conn.close()
+            return
+        candidates, logical_now = msg
+        conn.send((g.submit_many(candidates, logical_now), _state(g)))
+
+
+class _ProcessShard:
+    def __init__(self, ctx, n, gate_opts, shard_opts):
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(target=_serve,
+                                args=(child, n, gate_opts, shard_opts),
+                                daemon=True)
+        self.proc.start()
+        child.close()
+
+    def send(self, candidates, logical_now):
+        self.conn.send((candidates, logical_now))
+
+    def recv(self):
+        return self.conn.recv()
+
+    def close(self):
+        self.conn.send(None)
+        self.proc.join()
+
+
+class _LocalShard:
+    def __init__(self, n, gate_opts, shard_opts):
+        self.gate = _gate(n, gate_opts, shard_opts)
+        self._result = None
+
+    def send(self, candidates, logical_now):
+        self._result = (self.gate.submit_many(candidates, logical_now),
+                        _state(self.gate))
+
+    def recv(self):
+        return self._result
+
+    def close(self):
+        pass
+
+
+class ShardedGate:
+    """N independent gates behind one submit surface and one root per epoch."""
+
+    def __init__(self, shards=4, processes=False, shard_opts=None, **gate_opts):
+        shared = [k for k in _STATEFUL if gate_opts.get(k) is not None]
+        if shared:
+            raise ValueError(f"{shared} would be shared by every shard; "
+                             f"give each shard its own via shard_opts")
+        self.n = shards
+        if processes:
+            ctx = multiprocessing.get_context()
+            self.shards = [_ProcessShard(ctx, n, gate_opts, shard_opts)
+                           for n in range(shards)]
+        else:
+            self.shards = [_LocalShard(n, gate_opts, shard_opts)
+                           for n in range(shards)]
+        self.heads = [Gate.GENESIS] * shards
+        self.merits = [0.0] * shards
+        self.effects = []                 # BIND effects, in submission order
+        self.roots = {}                   # logical epoch -> combined root
+
+    def submit(self, candidate, logical_now):
+        return self.submit_many([candidate], logical_now)[0]
+
+    def submit_many(self, candidates, logical_now):
+        """Route a batch to its shards (all shards work at once), return the
+        receipts in submission order and publish the epoch's root."""
+        candidates = list(candidates)
+        buckets = [[] for _ in range(self.n)]
+        order = []
+        for c in candidates:
+            s = shard_of(c.get("actor"), self.n)
+            order.append((s, len(buckets[s])))
+            buckets[s].append(c)
+        busy = [s for s in range(self.n) if buckets[s]]
+        for s in busy:
+            self.shards[s].send(buckets[s], logical_now)
+        results = [None] * self.n
+        for s in busy:
+            results[s], (self.heads[s], self.merits[s]) = self.shards[s].recv()
+        self.roots[logical_now] = self.root(logical_now)
+        receipts = [results[s][i] for s, i in order]
+        self.effects += [c.get("id") for c, r in zip(candidates, receipts)
+                         if r["content"]["decision"] == "BIND"]
+        return receipts
+
+    def root(self, epoch):
+        return combined_root(self.heads, epoch)
+
+    @property
+    def merit(self):
+        return sum(self.merits)
+
+    def close(self):
+        for shard in self.shards:
+            shard.close()